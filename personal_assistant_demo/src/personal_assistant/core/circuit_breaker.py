@@ -1,7 +1,7 @@
 # circuit_breaker.py
 import time
 from dataclasses import dataclass
-from typing import Dict
+from typing import Dict, Iterable, Tuple
 
 @dataclass
 class BreakerConfig:
@@ -119,12 +119,24 @@ class ToolCircuitBreakerRegistry:
     
     def allow_request(self, tool_name: str) -> bool:
         """Check if request to tool should be allowed"""
-        return self.get_breaker(tool_name).allow()
+        breaker = self.breakers.get(tool_name)
+        if breaker is None:
+            return True  # No failure history yet - breaker would be CLOSED
+        return breaker.allow()
     
     def record_result(self, tool_name: str, success: bool):
         """Record result for a tool call"""
         self.get_breaker(tool_name).on_result(success)
     
+    def record_bulk(self, results: Iterable[Tuple[str, bool]]):
+        """Record a batch of (tool_name, success) results, resolving each breaker once"""
+        breakers: Dict[str, CircuitBreaker] = {}
+        for tool_name, success in results:
+            breaker = breakers.get(tool_name)
+            if breaker is None:
+                breaker = breakers[tool_name] = self.get_breaker(tool_name)
+            breaker.on_result(success)
+    
     def get_all_metrics(self) -> Dict[str, Dict]:
         """Get metrics for all tools"""
         return {tool: breaker.get_metrics() for tool, breaker in self.breakers.items()}
@@ -15,9 +15,13 @@ from pathlib import Path
 from typing import Dict, Any, List, Set, Optional
 import time
 import hashlib
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# Canonical (key-sorted) compact JSON bytes; hashed directly, no str round-trip
+_CANONICAL_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
 class ToolRegistry:
     """
     Production tool registry with metadata for optimization and safety.
@@ -129,8 +133,10 @@ class ToolRegistry:
     def generate_idempotency_key(self, user_request: str, step_number: int, 
                                 tool_name: str, tool_input: Dict[str, Any]) -> str:
         """Generate unique idempotency key for impure operations."""
-        content = f"{user_request}:{step_number}:{tool_name}:{json.dumps(tool_input, sort_keys=True)}"
-        return hashlib.sha256(content.encode()).hexdigest()[:16]
+        prefix = f"{user_request}:{step_number}:{tool_name}:".encode()
+        content = prefix + orjson.dumps(tool_input, option=_CANONICAL_OPTIONS)
+        # Non-cryptographic use: BLAKE2b sized to the 16 hex chars we keep
+        return hashlib.blake2b(content, digest_size=8).hexdigest()
     
     def is_duplicate_operation(self, idempotency_key: str) -> bool:
         """Check if operation has already been completed."""
@@ -187,5 +193,5 @@ class ToolRegistry:
     
     def _create_cache_key(self, tool_name: str, tool_input: Dict[str, Any]) -> str:
         """Create cache key for tool call."""
-        content = f"{tool_name}:{json.dumps(tool_input, sort_keys=True)}"
-        return hashlib.sha256(content.encode()).hexdigest()
+        content = f"{tool_name}:".encode() + orjson.dumps(tool_input, option=_CANONICAL_OPTIONS)
+        return hashlib.blake2b(content, digest_size=32).hexdigest()
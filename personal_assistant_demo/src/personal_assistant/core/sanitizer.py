@@ -1,5 +1,6 @@
 # sanitizer.py
 import re
+from functools import lru_cache
 from typing import Optional, Dict, List
 
 # Regex patterns for PII detection
@@ -10,6 +11,11 @@ IBAN_RE = re.compile(r'\b[A-Z]{2}\d{2}[A-Z0-9]{11,30}\b')
 SSN_RE = re.compile(r'\b\d{3}-?\d{2}-?\d{4}\b')  # US Social Security Numbers
 API_KEY_RE = re.compile(r'\b[A-Za-z0-9]{20,}\b')  # Potential API keys (20+ chars alphanumeric)
 
+
+# Joins texts for a batched sweep; non-word and unmatched by every PII pattern, so no match can span two texts
+_BATCH_SEPARATOR = '\0'
+
+
 class PIISanitizer:
     """Fast regex-based PII detection and sanitization"""
     
@@ -29,6 +35,11 @@ class PIISanitizer:
             'SSN': SSN_RE,
             'API_KEY': API_KEY_RE
         }
+        # Replacement tokens built once; patterns are applied in turn because
+        # earlier redactions decide what later patterns can still match
+        self.redactions = [
+            (pattern, f'[REDACTED:{pii_type}]') for pii_type, pattern in self.patterns.items()
+        ]
     
     def sanitize(self, text: str, preserve_structure: bool = True) -> str:
         """
@@ -49,18 +60,44 @@ class PIISanitizer:
             text = text[:self.max_length] + "...[TRUNCATED]"
         
         # Apply PII redaction patterns
-        sanitized = text
-        for pii_type, pattern in self.patterns.items():
-            replacement = f'[REDACTED:{pii_type}]'
-            sanitized = pattern.sub(replacement, sanitized)
+        sanitized = self._redact(text)
         
-        # Remove control characters but preserve basic formatting
-        if preserve_structure:
-            sanitized = ''.join(ch for ch in sanitized if ch.isprintable() or ch in '\n\r\t ')
-        else:
-            sanitized = ''.join(ch for ch in sanitized if ch.isprintable())
+        return self._strip_control_chars(sanitized, preserve_structure)
+    
+    def sanitize_many(self, texts: List[str], preserve_structure: bool = True) -> List[str]:
+        """
+        Sanitize several texts with one sweep per PII pattern over their concatenation
+        
+        Args:
+            texts: Input texts to sanitize
+            preserve_structure: If True, maintain original text structure
             
-        return sanitized
+        Returns:
+            Sanitized texts, in input order
+        """
+        if not texts:
+            return []
+        
+        # Texts that need truncation or contain the separator take the per-text path
+        if any(len(text) > self.max_length or _BATCH_SEPARATOR in text for text in texts):
+            return [self.sanitize(text, preserve_structure) for text in texts]
+        
+        blob = self._redact(_BATCH_SEPARATOR.join(texts))
+        blob = self._strip_control_chars(blob, preserve_structure, keep=_BATCH_SEPARATOR)
+        return blob.split(_BATCH_SEPARATOR)
+    
+    def _redact(self, text: str) -> str:
+        """Replace each PII type with its token, one pattern after another"""
+        for pattern, replacement in self.redactions:
+            text = pattern.sub(replacement, text)
+        return text
+    
+    @staticmethod
+    def _strip_control_chars(text: str, preserve_structure: bool, keep: str = '') -> str:
+        """Remove control characters, optionally preserving basic formatting"""
+        if preserve_structure:
+            keep += '\n\r\t '
+        return ''.join(ch for ch in text if ch.isprintable() or ch in keep)
     
     def detect_pii(self, text: str) -> Dict[str, List[str]]:
         """
@@ -138,10 +175,16 @@ def detect_pii(text: str) -> Dict[str, List[str]]:
     """
     return _default_sanitizer.detect_pii(text)
 
+# Observations shorter than this are memoized; longer ones are always recomputed to bound memory
+_OBSERVATION_CACHE_MAX_LEN = 4096
+
 def sanitize_observation(observation: str, preserve_structure: bool = True) -> str:
     """
     Sanitize tool observation before sending to LLM or logs
     
+    Tool outputs repeat heavily within a session, so short observations are
+    served from an LRU cache keyed on the raw string.
+    
     Args:
         observation: Tool execution result or observation
         preserve_structure: Whether to preserve text formatting
@@ -151,13 +194,44 @@ def sanitize_observation(observation: str, preserve_structure: bool = True) -> s
     """
     if not observation:
         return observation
+    
+    if isinstance(observation, str) and len(observation) < _OBSERVATION_CACHE_MAX_LEN:
+        return _sanitize_observation_cached(observation, preserve_structure)
+    return _sanitize_observation_uncached(observation, preserve_structure)
+
+def sanitize_observations(observations: List[str], preserve_structure: bool = True) -> List[str]:
+    """
+    Sanitize a batch of tool observations with one sweep per PII pattern
+    
+    Args:
+        observations: Tool execution results or observations
+        preserve_structure: Whether to preserve text formatting
         
+    Returns:
+        Sanitized observations, in input order
+    """
+    return [
+        _truncate_observation(sanitized)
+        for sanitized in _default_sanitizer.sanitize_many(observations, preserve_structure)
+    ]
+
+def clear_observation_cache() -> None:
+    """Clear memoized sanitize_observation results (e.g. between tests)"""
+    _sanitize_observation_cached.cache_clear()
+
+def _sanitize_observation_uncached(observation: str, preserve_structure: bool) -> str:
+    """Sanitize an observation without consulting the cache"""
     # Apply PII sanitization
     sanitized = _default_sanitizer.sanitize(observation, preserve_structure)
     
-    # Additional safety: Ensure we don't exceed typical LLM context limits
+    return _truncate_observation(sanitized)
+
+def _truncate_observation(sanitized: str) -> str:
+    """Ensure we don't exceed typical LLM context limits"""
     max_obs_length = 2000  # Conservative limit for observations
     if len(sanitized) > max_obs_length:
         sanitized = sanitized[:max_obs_length] + "...[OBSERVATION_TRUNCATED]"
     
     return sanitized
+
+_sanitize_observation_cached = lru_cache(maxsize=4096)(_sanitize_observation_uncached)
@@ -14,22 +14,84 @@ Based on ChatGPT's production hardening recommendations.
 import json
 import logging
 import asyncio
+import copy
 import time
-from typing import Dict, List, Any, Optional
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from pathlib import Path
 import jsonschema
+import orjson
 from jsonschema import validate, ValidationError
 from production_tool_registry import ProductionToolRegistry
 from circuit_breaker import ToolCircuitBreakerRegistry, BreakerConfig
-from sanitizer import sanitize_observation
+from sanitizer import sanitize_observation, sanitize_observations
+from executor_tools import SUMMARY_FORMATTERS, TOOLS, load_tool_result
 
 logger = logging.getLogger(__name__)
 
+# Top-level tool output fields that may carry PII
+_PII_SENSITIVE_FIELDS = frozenset({"message", "data", "error", "description", "content"})
+
+# Value types the PII sanitizers descend into or redact
+_SANITIZED_TYPES = (str, dict, list)
+
+
+def _handler_for(handlers: Dict[type, Callable], value: Any, default: Optional[Callable] = None) -> Optional[Callable]:
+    """Look up value's handler by exact type, falling back to isinstance for subclasses."""
+    handler = handlers.get(type(value))
+    if handler is not None:
+        return handler
+    for base, candidate in handlers.items():
+        if isinstance(value, base):
+            return candidate
+    return default
+
+
+# Resource bits used to relate impure and read operations (task=1, client=2, meeting=4)
+_RESOURCE_BITS = (("task", 1), ("client", 2), ("meeting", 4))
+
+
+def _compute_resource_mask(tool_name: str) -> int:
+    """Encode the resources a tool operates on as a bitmask."""
+    mask = 0
+    for resource, bit in _RESOURCE_BITS:
+        if resource in tool_name:
+            mask |= bit
+    return mask
+
+
+@dataclass
+class _PlanView:
+    """Struct-of-arrays view over plan steps, built in a single pass over the plan."""
+    ids: List[str]
+    tools: List[str]
+    purities: List[str]
+    after: List[List[int]]  # Dependency indices into the arrays above
+
+    @classmethod
+    def from_steps(cls, steps: List[Dict[str, Any]], tool_registry: ProductionToolRegistry) -> "_PlanView":
+        """Collect ids, tools, purities and dependency edges in one traversal."""
+        ids, tools, purities, after = [], [], [], []
+        index_of = {}
+        for i, step in enumerate(steps):
+            tool_name = step["tool"]
+            ids.append(step["id"])
+            tools.append(tool_name)
+            purities.append(tool_registry.get_tool_purity(tool_name))
+            # Dependencies can only point at earlier steps
+            after.append([index_of[dep] for dep in step.get("after", []) if dep in index_of])
+            index_of[step["id"]] = i
+        return cls(ids=ids, tools=tools, purities=purities, after=after)
+
+
 class EnhancedPlannerExecutorAgent:
     """
     Production-grade planner-executor agent with ChatGPT's hardening features.
     """
     
+    # Tool name → async tool function
+    _TOOLS = TOOLS
+    
     # JSON Schemas - ChatGPT DAG-aware schema
     PLANNER_SCHEMA = {
         "$schema": "https://json-schema.org/draft/2020-12/schema",
@@ -104,6 +166,12 @@ class EnhancedPlannerExecutorAgent:
         ]
     }
     
+    # Resource bitmask per known tool, computed once at import
+    RESOURCE_MASKS = {
+        tool: _compute_resource_mask(tool)
+        for tool in PLANNER_SCHEMA["properties"]["plan"]["items"]["properties"]["tool"]["enum"]
+    }
+    
     def __init__(self, config_path: str):
         """Initialize the enhanced planner-executor agent."""
         self.config_path = Path(config_path)
@@ -111,6 +179,15 @@ class EnhancedPlannerExecutorAgent:
         self.per_step_timeout = 5.0
         self.overall_deadline = 20.0
         
+        # Per-type sanitizers for top-level output fields (exact type first, then subclasses)
+        self._field_sanitizers = {
+            str: sanitize_observation,
+            dict: self._sanitize_dict,
+            list: self._sanitize_list,
+        }
+        # Per-type handlers for top-level list items; anything not listed is deep-copied
+        self._item_sanitizers = {str: sanitize_observation}
+        
         # Initialize production tool registry
         registry_path = Path(__file__).parent / "tool_registry.json"
         self.tool_registry = ProductionToolRegistry(str(registry_path))
@@ -125,8 +202,8 @@ class EnhancedPlannerExecutorAgent:
         )
         self.circuit_breakers = ToolCircuitBreakerRegistry(breaker_config)
         
-        logger.info(f"🔧 Initialized with {len(self.tool_registry.available_tools)} production tools")
-        logger.info(f"🛡️ Circuit breakers active with 70% failure threshold")
+        logger.info("🔧 Initialized with %d production tools", len(self.tool_registry.available_tools_set))
+        logger.info("🛡️ Circuit breakers active with 70% failure threshold")
         
     async def run_agent(self, user_request: str) -> str:
         """
@@ -139,35 +216,50 @@ class EnhancedPlannerExecutorAgent:
             Final response after executing all planned steps
         """
         start_time = time.time()
+        # Circuit breaker outcomes are buffered and recorded once per execution group;
+        # whatever is still buffered is recorded in the finally below, even on errors
+        breaker_outcomes = []
         
         try:
             # Step 1: Create and validate execution plan
-            logger.info(f"🎯 Planning request: {user_request}")
+            logger.info("🎯 Planning request: %s", user_request)
             plan = await self._create_validated_plan(user_request)
-            logger.info(f"📋 Generated plan: {json.dumps(plan, indent=2)}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("📋 Generated plan: %s", orjson.dumps(plan, option=orjson.OPT_INDENT_2).decode())
             
             # Step 2: Normalize and lint plan using production registry
-            normalized_plan = self._normalize_plan(plan)
-            self._validate_plan_safety(normalized_plan)
+            normalized_plan, cache_keys = self._normalize_plan(plan)
+            plan_view = _PlanView.from_steps(normalized_plan["plan"], self.tool_registry)
+            self._validate_plan_safety(plan_view)
             
             # Production Feature: Check for parallel execution opportunities
             execution_groups = self.tool_registry.get_parallel_execution_groups(normalized_plan)
-            parallel_groups = [group for group in execution_groups if len(group) > 1]
-            if parallel_groups:
-                logger.info(f"⚡ Plan allows {len(parallel_groups)} parallel execution groups")
+            n_parallel = sum(1 for group in execution_groups if len(group) > 1)
+            if n_parallel:
+                logger.info("⚡ Plan allows %d parallel execution groups", n_parallel)
             
-            logger.info(f"✅ Plan validated, normalized, and analyzed for parallelism")
+            logger.info("✅ Plan validated, normalized, and analyzed for parallelism")
+            
+            group_ends = set()
+            group_end = 0
+            for group in execution_groups:
+                group_end += len(group)
+                group_ends.add(group_end)
             
             # Step 3: Execute plan step by step with error recovery
-            results = []
-            for i, step in enumerate(normalized_plan["plan"], 1):
+            steps = normalized_plan["plan"]
+            n = len(steps)
+            results = [None] * n
+            results_by_id = {}
+            for i, step in enumerate(steps, 1):
                 # Check deadline
                 if time.time() - start_time > self.overall_deadline:
-                    logger.warning(f"⏰ Deadline reached, providing partial results")
-                    return self._create_partial_response(user_request, results, normalized_plan["plan"][i-1:])
+                    logger.warning("⏰ Deadline reached, providing partial results")
+                    return self._create_partial_response(user_request, results[:i-1], steps[i-1:])
                 
-                remaining = len(normalized_plan["plan"]) - i + 1
-                logger.info(f"⚡ Executing step {i}/{len(normalized_plan['plan'])}: {step['tool']}")
+                tool = plan_view.tools[i-1]
+                remaining = n - i + 1
+                logger.info("⚡ Executing step %d/%d: %s", i, n, tool)
                 
                 result = await self._execute_step_with_retry(
                     user_request=user_request,
@@ -175,14 +267,25 @@ class EnhancedPlannerExecutorAgent:
                     step_number=i,
                     remaining_steps=remaining,
                     current_step=step,
-                    previous_results=results[-1] if results else None
+                    previous_results={dep: results_by_id[dep] for dep in step.get("after", []) if dep in results_by_id},
+                    breaker_outcomes=breaker_outcomes,
+                    cache_key=cache_keys[i-1]
                 )
                 
-                results.append(result)
-                logger.info(f"✅ Step {i} completed: {step['tool']}")
+                results[i-1] = result
+                results_by_id[step["id"]] = result
+                logger.info("✅ Step %d completed: %s", i, tool)
+                
+                if i in group_ends:
+                    self.circuit_breakers.record_bulk(breaker_outcomes)
+                    breaker_outcomes.clear()
+            
+            # Flush anything left over (e.g. steps not covered by a group) before reporting metrics
+            self.circuit_breakers.record_bulk(breaker_outcomes)
+            breaker_outcomes.clear()
             
             # Step 4: Generate final response with production metrics
-            final_answer = await self._generate_final_response(
+            final_answer = self._generate_final_response(
                 user_request=user_request,
                 plan=normalized_plan,
                 results=results
@@ -194,12 +297,12 @@ class EnhancedPlannerExecutorAgent:
             cache_hits = sum(1 for r in results if r.get("cache_hit", False))
             idempotent_skips = sum(1 for r in results if r.get("idempotent_skip", False))
             
-            logger.info(f"🎉 Agent completed successfully in {total_time:.2f}s")
-            logger.info(f"📈 Performance: {cache_hits} cache hits, {idempotent_skips} idempotent skips")
+            logger.info("🎉 Agent completed successfully in %.2fs", total_time)
+            logger.info("📈 Performance: %d cache hits, %d idempotent skips", cache_hits, idempotent_skips)
             
             # Log tool registry stats
             stats = self.tool_registry.get_tool_stats()
-            logger.info(f"📊 Registry stats: {stats['pure_cache_entries']} pure cached, {stats['read_cache_entries']} read cached")
+            logger.info("📊 Registry stats: %d pure cached, %d read cached", stats['pure_cache_entries'], stats['read_cache_entries'])
             
             # Log circuit breaker metrics (ChatGPT Phase 3)
             circuit_blocked = sum(1 for r in results if r.get("circuit_breaker_blocked", False))
@@ -207,21 +310,23 @@ class EnhancedPlannerExecutorAgent:
             open_breakers = [tool for tool, metrics in breaker_metrics.items() if metrics['state'] == 'open']
             
             if circuit_blocked > 0 or open_breakers:
-                logger.info(f"🛡️ Circuit breakers: {circuit_blocked} requests blocked, {len(open_breakers)} breakers OPEN")
+                logger.info("🛡️ Circuit breakers: %d requests blocked, %d breakers OPEN", circuit_blocked, len(open_breakers))
                 if open_breakers:
-                    logger.warning(f"⚠️ OPEN breakers: {', '.join(open_breakers)}")
+                    logger.warning("⚠️ OPEN breakers: %s", ', '.join(open_breakers))
             else:
-                logger.info(f"🛡️ Circuit breakers: All systems operational")
+                logger.info("🛡️ Circuit breakers: All systems operational")
             
             return final_answer
             
         except Exception as e:
-            logger.error(f"❌ Agent execution failed: {e}")
-            return json.dumps({
+            logger.error("❌ Agent execution failed: %s", e)
+            return orjson.dumps({
                 "success": False,
                 "error": f"Agent execution failed: {str(e)}",
                 "error_code": "AGENT_EXECUTION_ERROR"
-            })
+            }).decode()
+        finally:
+            self.circuit_breakers.record_bulk(breaker_outcomes)
     
     async def _create_validated_plan(self, user_request: str) -> Dict[str, Any]:
         """Create and validate execution plan using ChatGPT's schema."""
@@ -348,7 +453,7 @@ class EnhancedPlannerExecutorAgent:
             })
         
         # Create DAG with smart dependencies
-        self._optimize_dag_dependencies(plan_steps)
+        self._optimize_dag_dependencies(plan_steps, _PlanView.from_steps(plan_steps, self.tool_registry))
         
         plan = {"plan": plan_steps}
         
@@ -363,84 +468,81 @@ class EnhancedPlannerExecutorAgent:
                 tool_input = step["input"]
                 is_valid, error = self.tool_registry.validate_tool_input(tool_name, tool_input)
                 if not is_valid:
-                    logger.error(f"❌ Tool input validation failed for {tool_name}: {error}")
+                    logger.error("❌ Tool input validation failed for %s: %s", tool_name, error)
                     raise ValueError(f"Tool input validation failed: {error}")
             
             logger.info("✅ All tool inputs validated against registry schemas")
             
         except ValidationError as e:
-            logger.error(f"❌ Plan validation failed: {e.message}")
+            logger.error("❌ Plan validation failed: %s", e.message)
             raise ValueError(f"Generated plan violates schema: {e.message}")
         
         return plan
     
-    def _optimize_dag_dependencies(self, plan_steps: List[Dict[str, Any]]) -> None:
+    def _optimize_dag_dependencies(self, plan_steps: List[Dict[str, Any]], view: _PlanView) -> None:
         """Optimize DAG dependencies for maximum parallelism while maintaining correctness."""
         
         # Apply ChatGPT's smart dependency rules:
         # 1. Pure functions can run independently after any required impure operations
         # 2. Read-only functions depend on impure operations that change the data they read
         # 3. Impure operations should be sequenced when they affect the same resources
-        
+
+        # Purities come from the plan view; resources are looked up once per step
+        purities = view.purities
+        masks = [self._resource_mask(tool_name) for tool_name in view.tools]
+
         for i, step in enumerate(plan_steps):
-            tool_name = step["tool"]
-            purity = self.tool_registry.get_tool_purity(tool_name)
-            
+            purity = purities[i]
+
             if purity == "pure":
-                # Pure calculations can run independently 
-                step["after"] = []
+                # Pure calculations can run independently
+                view.after[i] = []
             elif purity == "read_only":
                 # Read-only operations depend on preceding impure operations that modify data
-                impure_deps = []
-                for j in range(i):
-                    prev_step = plan_steps[j]
-                    prev_purity = self.tool_registry.get_tool_purity(prev_step["tool"])
-                    if prev_purity == "impure":
-                        # Check if this impure operation affects what we're reading
-                        if self._operations_related(prev_step["tool"], tool_name):
-                            impure_deps.append(prev_step["id"])
-                
-                step["after"] = impure_deps
-            # impure operations keep their existing dependencies
-        
-        logger.debug(f"🔧 DAG optimization complete - dependencies analyzed")
-    
+                # they read (i.e. operations touching the same resources)
+                view.after[i] = [j for j in range(i) if purities[j] == "impure" and masks[j] & masks[i]]
+            else:
+                # impure operations keep their existing dependencies
+                continue
+
+            step["after"] = [view.ids[j] for j in view.after[i]]
+
+        logger.debug("🔧 DAG optimization complete - dependencies analyzed")
+
+    @classmethod
+    def _resource_mask(cls, tool_name: str) -> int:
+        """Get the resource bitmask (task, client, meeting) a tool operates on."""
+        mask = cls.RESOURCE_MASKS.get(tool_name)
+        return mask if mask is not None else _compute_resource_mask(tool_name)
+
     def _operations_related(self, impure_tool: str, read_tool: str) -> bool:
         """Check if an impure operation affects what a read operation accesses."""
-        
-        # Simple heuristics for related operations
-        if "task" in impure_tool and "task" in read_tool:
-            return True
-        if "client" in impure_tool and "client" in read_tool:
-            return True
-        if "meeting" in impure_tool and "meeting" in read_tool:
-            return True
-            
-        return False
+
+        # Simple heuristic: both operations touch the same resource
+        return bool(self._resource_mask(impure_tool) & self._resource_mask(read_tool))
     
-    def _normalize_plan(self, plan: Dict[str, Any]) -> Dict[str, Any]:
-        """Normalize plan using ChatGPT's production rules via tool registry."""
+    def _normalize_plan(self, plan: Dict[str, Any]) -> Tuple[Dict[str, Any], List[Optional[str]]]:
+        """Normalize plan using ChatGPT's production rules via tool registry; also returns per-step cache keys."""
         
         # Use production tool registry for advanced normalization
-        return self.tool_registry.normalize_plan(plan)
+        return self.tool_registry.normalize_plan_with_keys(plan)
     
-    def _validate_plan_safety(self, plan: Dict[str, Any]) -> None:
+    def _validate_plan_safety(self, view: _PlanView) -> None:
         """Apply safety lints: budget checks, determinism."""
         
-        steps = plan["plan"]
+        step_count = len(view.tools)
         
         # Budget check: max steps
-        if len(steps) > 12:
-            raise ValueError(f"Plan exceeds maximum steps: {len(steps)} > 12")
+        if step_count > 12:
+            raise ValueError(f"Plan exceeds maximum steps: {step_count} > 12")
         
         # Estimate runtime budget (rough)
-        estimated_time = len(steps) * 2  # 2s per step estimate
+        estimated_time = step_count * 2  # 2s per step estimate
         if estimated_time > self.overall_deadline:
-            logger.warning(f"⚠️ Plan may exceed deadline: {estimated_time}s > {self.overall_deadline}s")
+            logger.warning("⚠️ Plan may exceed deadline: %ss > %ss", estimated_time, self.overall_deadline)
         
         # Check for valid tool sequences
-        tool_sequence = [step["tool"] for step in steps]
-        logger.info(f"📊 Tool sequence: {' → '.join(tool_sequence)}")
+        logger.info("📊 Tool sequence: %s", ' → '.join(view.tools))
         
         logger.info("✅ Plan passes safety validation")
     
@@ -451,16 +553,35 @@ class EnhancedPlannerExecutorAgent:
         step_number: int,
         remaining_steps: int,
         current_step: Dict[str, Any],
-        previous_results: Optional[Dict[str, Any]]
+        previous_results: Optional[Dict[str, Dict[str, Any]]],
+        breaker_outcomes: Optional[List[Tuple[str, bool]]] = None,
+        cache_key: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Execute a single step with ChatGPT's production features: caching, idempotency, retries."""
+        """
+        Execute a single step with ChatGPT's production features: caching, idempotency, retries.
+        
+        previous_results holds the results of the step's declared predecessors (its "after"
+        list), keyed by step id.
+        
+        Circuit breaker outcomes are appended to breaker_outcomes when given (the caller records
+        them in bulk); otherwise they are recorded immediately.
+        
+        cache_key is the step's precomputed key from normalize_plan_with_keys(), if any.
+        """
+        
+        if breaker_outcomes is None:
+            record_outcome = self.circuit_breakers.record_result
+        else:
+            def record_outcome(tool: str, ok: bool) -> None:
+                breaker_outcomes.append((tool, ok))
         
         tool_name = current_step["tool"]
         tool_input = current_step["input"]
+        meta = self.tool_registry.get_tool_meta(tool_name)
         
         # Production Feature 1: Circuit breaker check (ChatGPT Phase 3)
         if not self.circuit_breakers.allow_request(tool_name):
-            logger.warning(f"🚫 Circuit breaker OPEN for {tool_name} - request denied")
+            logger.warning("🚫 Circuit breaker OPEN for %s - request denied", tool_name)
             breaker_metrics = self.circuit_breakers.get_breaker(tool_name).get_metrics()
             return {
                 "step": step_number,
@@ -477,11 +598,16 @@ class EnhancedPlannerExecutorAgent:
             }
         
         # Production Feature 2: Check cache first (pure/read_only tools)
-        cached_result = self.tool_registry.get_cached_result(tool_name, tool_input)
+        # Key is computed once (normally by normalize_plan_with_keys) and reused for cache_result() after a successful run
+        if not meta["cacheable"]:
+            cache_key = None
+        elif cache_key is None:
+            cache_key = self.tool_registry.generate_cache_key(tool_name, tool_input)
+        cached_result = self.tool_registry.get_cached_result(tool_name, tool_input, cache_key) if cache_key else None
         if cached_result:
-            logger.info(f"📦 Cache hit for {tool_name}")
+            logger.info("📦 Cache hit for %s", tool_name)
             try:
-                result_data = json.loads(cached_result)
+                result_data = load_tool_result(cached_result)
                 # Apply PII sanitization to cached results
                 sanitized_output = self._sanitize_tool_output(result_data)
                 return {
@@ -494,17 +620,17 @@ class EnhancedPlannerExecutorAgent:
                     "cache_hit": True
                 }
             except json.JSONDecodeError:
-                logger.warning(f"⚠️ Invalid cached result for {tool_name}, proceeding with execution")
+                logger.warning("⚠️ Invalid cached result for %s, proceeding with execution", tool_name)
         
         # Production Feature 3: Idempotency check for impure operations
         idempotency_key = None
-        if self.tool_registry.requires_idempotency_key(tool_name):
+        if meta["needs_idempotency"]:
             idempotency_key = self.tool_registry.generate_idempotency_key(
                 user_request, step_number, tool_name, tool_input
             )
             
             if self.tool_registry.is_duplicate_operation(idempotency_key):
-                logger.info(f"🔄 Idempotency check: operation {idempotency_key} already completed")
+                logger.info("🔄 Idempotency check: operation %s already completed", idempotency_key)
                 return {
                     "step": step_number,
                     "tool": tool_name,
@@ -520,50 +646,38 @@ class EnhancedPlannerExecutorAgent:
                 # Add timeout to tool execution
                 start_time = time.time()
                 
-                # Import and execute the actual tool functions
-                if tool_name == "add_task":
-                    from personal_assistant.tools.tasks import add_task
-                    result = await add_task(**tool_input)
-                    
-                elif tool_name == "list_tasks":
-                    from personal_assistant.tools.tasks import list_tasks
-                    result = await list_tasks(**tool_input)
-                    
-                elif tool_name == "calculate_percentage":
-                    from personal_assistant.tools.calculator import calculate_percentage
-                    result = await calculate_percentage(**tool_input)
-                    
-                elif tool_name == "current_time":
-                    from personal_assistant.tools.datetime_info import get_current_time
-                    result = await get_current_time(**tool_input)
-                    
+                # Dispatch to the actual tool function
+                handler = self._TOOLS.get(tool_name)
+                if handler is not None:
+                    result = await handler(**tool_input)
                 else:
-                    result = json.dumps({
+                    result = {
                         "success": False,
                         "error": f"Unknown tool: {tool_name}",
                         "error_code": "UNKNOWN_TOOL"
-                    })
+                    }
                 
                 execution_time = time.time() - start_time
                 
                 # Check timeout
                 if execution_time > self.per_step_timeout:
-                    logger.warning(f"⚠️ Step {step_number} exceeded timeout: {execution_time:.2f}s")
+                    logger.warning("⚠️ Step %d exceeded timeout: %.2fs", step_number, execution_time)
                 
                 # Parse and validate result
                 try:
-                    result_data = json.loads(result)
+                    result_data = load_tool_result(result)
                     
                     # Check for success
                     success = result_data.get("success", False) or ("error" not in result_data and "error_code" not in result_data)
                     
                     # Record circuit breaker result (ChatGPT Phase 3)
-                    self.circuit_breakers.record_result(tool_name, success)
+                    record_outcome(tool_name, success)
                     
                     if success:
                         
                         # Production Feature 4: Cache successful results
-                        self.tool_registry.cache_result(tool_name, tool_input, result)
+                        if meta["cacheable"]:
+                            self.tool_registry.cache_result(tool_name, tool_input, result, cache_key)
                         
                         # Production Feature 5: Mark idempotent operation as complete
                         if idempotency_key:
@@ -587,7 +701,7 @@ class EnhancedPlannerExecutorAgent:
                         error_code = result_data.get("error_code", "UNKNOWN_ERROR")
                         if attempt < self.max_retries and error_code in ["TIMEOUT", "RATE_LIMIT"]:
                             wait_time = 0.25 * (2 ** attempt)  # Exponential backoff
-                            logger.warning(f"🔄 Retrying step {step_number} in {wait_time}s (attempt {attempt + 1})")
+                            logger.warning("🔄 Retrying step %d in %ss (attempt %d)", step_number, wait_time, attempt + 1)
                             await asyncio.sleep(wait_time)
                             continue
                         else:
@@ -617,11 +731,11 @@ class EnhancedPlannerExecutorAgent:
                     
             except Exception as e:
                 # Record exception as circuit breaker failure
-                self.circuit_breakers.record_result(tool_name, False)
+                record_outcome(tool_name, False)
                 
                 if attempt < self.max_retries:
                     wait_time = 0.25 * (2 ** attempt)
-                    logger.warning(f"🔄 Exception in step {step_number}, retrying in {wait_time}s: {e}")
+                    logger.warning("🔄 Exception in step %d, retrying in %ss: %s", step_number, wait_time, e)
                     await asyncio.sleep(wait_time)
                     continue
                 else:
@@ -648,26 +762,32 @@ class EnhancedPlannerExecutorAgent:
     def _truncate_observation(self, observation: Dict[str, Any]) -> Dict[str, Any]:
         """Truncate large observations following ChatGPT's recommendation."""
         
-        # If message is very long, truncate it
-        if "message" in observation and len(str(observation["message"])) > 500:
-            truncated_message = str(observation["message"])[:500] + "...(truncated)"
-            observation = observation.copy()
-            observation["message"] = truncated_message
-            observation["_truncated"] = True
-        
+        # If message is very long, truncate it (only clone the top level when needed)
+        message = observation.get("message")
+        if message is not None:
+            if not isinstance(message, str):
+                message = str(message)
+            if len(message) > 500:
+                observation = {**observation, "message": message[:500] + "...(truncated)", "_truncated": True}
+
         # If data contains large arrays, truncate them
-        if "data" in observation and isinstance(observation["data"], dict):
-            data = observation["data"].copy()
-            
+        data = observation.get("data")
+        if isinstance(data, dict):
+            truncated_data = None
+
             for key, value in data.items():
-                if isinstance(value, list) and len(value) > 3:
-                    truncated_count = len(value) - 3
-                    data[key] = value[:3] + [f"...(+{truncated_count} more)"]
-                    data["_truncated"] = True
-            
-            observation = observation.copy()
-            observation["data"] = data
-        
+                if isinstance(value, list):
+                    value_len = len(value)
+                    if value_len > 3:
+                        if truncated_data is None:
+                            truncated_data = dict(data)
+                        truncated_data[key] = value[:3] + [f"...(+{value_len - 3} more)"]
+
+            # Small results are returned as-is without any copy
+            if truncated_data is not None:
+                truncated_data["_truncated"] = True
+                observation = {**observation, "data": truncated_data}
+
         return observation
     
     def _sanitize_tool_output(self, output: Dict[str, Any]) -> Dict[str, Any]:
@@ -683,45 +803,57 @@ class EnhancedPlannerExecutorAgent:
         if not output:
             return output
         
-        # Create a deep copy to avoid modifying original
-        sanitized = json.loads(json.dumps(output))
-        
-        # Sanitize string fields that might contain PII
-        pii_sensitive_fields = ['message', 'data', 'error', 'description', 'content']
-        
-        for field in pii_sensitive_fields:
-            if field in sanitized:
-                if isinstance(sanitized[field], str):
-                    # Apply PII sanitization directly to string fields
-                    sanitized[field] = sanitize_observation(sanitized[field])
-                elif isinstance(sanitized[field], dict):
-                    # Recursively sanitize nested dictionaries
-                    sanitized[field] = self._sanitize_dict(sanitized[field])
-                elif isinstance(sanitized[field], list):
-                    # Sanitize list items if they're strings
-                    sanitized[field] = [
-                        sanitize_observation(item) if isinstance(item, str) else item
-                        for item in sanitized[field]
-                    ]
+        # Shallow copy; rewritten fields below get fresh containers, so the original is untouched
+        sanitized = dict(output)
+        
+        # Only visit sensitive fields that are actually present; native tool dicts may
+        # carry str/dict/list subclasses, which _handler_for also matches
+        field_sanitizers = self._field_sanitizers
+        for field in _PII_SENSITIVE_FIELDS & sanitized.keys():
+            value = sanitized[field]
+            handler = _handler_for(field_sanitizers, value)
+            if handler is not None:
+                sanitized[field] = handler(value)
         
         return sanitized
     
+    def _sanitize_list(self, items: List[Any]) -> List[Any]:
+        """Sanitize string items of a top-level list field; other items are copied as-is."""
+        item_sanitizers = self._item_sanitizers
+        return [_handler_for(item_sanitizers, item, copy.deepcopy)(item) for item in items]
+    
     def _sanitize_dict(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Recursively sanitize dictionary values."""
-        sanitized = {}
-        for key, value in data.items():
-            if isinstance(value, str):
-                sanitized[key] = sanitize_observation(value)
-            elif isinstance(value, dict):
-                sanitized[key] = self._sanitize_dict(value)
-            elif isinstance(value, list):
-                sanitized[key] = [
-                    sanitize_observation(item) if isinstance(item, str) else 
-                    self._sanitize_dict(item) if isinstance(item, dict) else item
-                    for item in value
-                ]
-            else:
-                sanitized[key] = value
+        """Sanitize nested dictionary/list values using an explicit work stack (no recursion)."""
+        sanitized = dict(data)
+        stack = [sanitized]
+        # (container, key) of every string leaf; all leaves are redacted in one batched sweep
+        slots = []
+        
+        while stack:
+            node = stack.pop()
+            entries = node.items() if type(node) is dict else enumerate(node)
+            
+            # Values are replaced in place; each container is shallow-copied once when first
+            # visited so the caller's output is never mutated
+            for key, value in entries:
+                value_type = type(value)
+                if value_type not in _SANITIZED_TYPES:
+                    # Subclasses are handled like their base type
+                    value_type = next((base for base in _SANITIZED_TYPES if isinstance(value, base)), None)
+                if value_type is str:
+                    slots.append((node, key))
+                elif value_type is dict:
+                    node[key] = child = dict(value)
+                    stack.append(child)
+                elif value_type is list:
+                    node[key] = child = list(value)
+                    stack.append(child)
+        
+        if slots:
+            texts = sanitize_observations([node[key] for node, key in slots])
+            for (node, key), text in zip(slots, texts):
+                node[key] = text
+        
         return sanitized
     
     def _create_partial_response(
@@ -735,22 +867,21 @@ class EnhancedPlannerExecutorAgent:
         completed_count = len(completed_results)
         remaining_count = len(remaining_steps)
         
-        summary = f"⏰ Completed {completed_count} of {completed_count + remaining_count} steps before deadline. "
+        parts = [f"⏰ Completed {completed_count} of {completed_count + remaining_count} steps before deadline. "]
         
         # Summarize completed steps
-        for result in completed_results:
-            if result["success"]:
-                summary += f"✅ {result['tool']} completed. "
-            else:
-                summary += f"❌ {result['tool']} failed. "
+        parts.extend(
+            f"✅ {result['tool']} completed. " if result["success"] else f"❌ {result['tool']} failed. "
+            for result in completed_results
+        )
         
         # List remaining steps
         remaining_tools = [step["tool"] for step in remaining_steps]
-        summary += f"Remaining: {', '.join(remaining_tools)}."
+        parts.append(f"Remaining: {', '.join(remaining_tools)}.")
         
-        return summary
+        return "".join(parts)
     
-    async def _generate_final_response(
+    def _generate_final_response(
         self,
         user_request: str,
         plan: Dict[str, Any],
@@ -758,41 +889,37 @@ class EnhancedPlannerExecutorAgent:
     ) -> str:
         """Generate final response summarizing all executed steps."""
         
-        success_count = sum(1 for r in results if r.get("success", True))  # Default to True since successful steps might not have explicit success flag
         total_steps = len(results)
-        total_time = sum(r.get("execution_time", 0) for r in results)
         
-        # Extract key information from results
-        summary_parts = []
+        # Single pass: count successes, total the time, and extract key information
+        success_count = 0
+        total_time = 0.0
+        # At most one fragment per step; trimmed to the filled prefix after the loop
+        summary_parts: List[Optional[str]] = [None] * total_steps
+        filled = 0
         
         for result in results:
-            tool = result["tool"]
-            output = result["output"]
+            # Default to True since successful steps might not have explicit success flag
+            success = result.get("success", True)
+            total_time += result.get("execution_time", 0)
+            if not success:
+                continue
             
-            if tool == "add_task" and result["success"]:
-                task_id = output.get("data", {}).get("task_id", "unknown")
-                task_desc = output.get("data", {}).get("description", "unknown")
-                summary_parts.append(f"Added task {task_id}: '{task_desc}'")
-                
-            elif tool == "list_tasks" and result["success"]:
-                # Count tasks from the output
-                message = output.get("message", "")
-                if "tasks" in message.lower():
-                    summary_parts.append("Listed all tasks")
-                    
-            elif tool == "calculate_percentage" and result["success"]:
-                calc_result = output.get("data", {}).get("result")
-                expression = output.get("data", {}).get("expression", "calculation")
-                if calc_result is not None:
-                    summary_parts.append(f"{expression} = {calc_result}")
+            success_count += 1
+            formatter = SUMMARY_FORMATTERS.get(result["tool"])
+            if formatter is not None:
+                part = formatter(result["output"])
+                if part:
+                    summary_parts[filled] = part
+                    filled += 1
+        del summary_parts[filled:]
         
         # Create final response
+        summary = ", ".join(summary_parts)
         if success_count == total_steps:
-            summary = ", ".join(summary_parts)
             final_response = f"✅ Successfully completed all {total_steps} steps in {total_time:.2f}s: {summary}."
         else:
             failed_count = total_steps - success_count
-            summary = ", ".join(summary_parts)
             final_response = f"⚠️ Completed {success_count}/{total_steps} steps ({failed_count} failed) in {total_time:.2f}s: {summary}."
         
         return final_response
@@ -0,0 +1,72 @@
+"""
+Tool dispatch and result summaries shared by the legacy planner-executor agents
+
+Both PlannerExecutorAgent and EnhancedPlannerExecutorAgent run the same demo
+tools and describe successful steps the same way in their final response.
+"""
+
+from typing import Any, Dict, Optional, Union
+
+import orjson
+
+from personal_assistant.tools.tasks import add_task, list_tasks
+from personal_assistant.tools.calculator import calculate_percentage
+from personal_assistant.tools.datetime_info import get_current_time
+
+
+# Tool name → async tool function, resolved once at import time
+TOOLS = {
+    "add_task": add_task,
+    "list_tasks": list_tasks,
+    "calculate_percentage": calculate_percentage,
+    "current_time": get_current_time,
+}
+
+
+def load_tool_result(result: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Return a tool result as a dict, parsing JSON only when the tool returned a string."""
+    if isinstance(result, dict):
+        return result
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    return orjson.loads(result)
+
+
+# Shared read-only fallback for missing "data" payloads; never mutate
+_EMPTY: Dict[str, Any] = {}
+
+# Summary templates, parsed once at import
+_ADD_TASK_FMT = "Added task {task_id}: '{task_desc}'".format
+_CALCULATION_FMT = "{expression} = {result}".format
+_LISTED_ALL_TASKS = "Listed all tasks"
+
+
+def _summarize_add_task(output: Dict[str, Any]) -> Optional[str]:
+    """Summarize an add_task result."""
+    data = output.get("data") or _EMPTY
+    task_id = data.get("task_id", "unknown")
+    task_desc = data.get("description", "unknown")
+    return _ADD_TASK_FMT(task_id=task_id, task_desc=task_desc)
+
+
+def _summarize_list_tasks(output: Dict[str, Any]) -> Optional[str]:
+    """Summarize a list_tasks result."""
+    message = output.get("message", "")
+    return _LISTED_ALL_TASKS if "tasks" in message.lower() else None
+
+
+def _summarize_calculation(output: Dict[str, Any]) -> Optional[str]:
+    """Summarize a calculate_percentage result."""
+    data = output.get("data") or _EMPTY
+    calc_result = data.get("result")
+    expression = data.get("expression", "calculation")
+    if calc_result is None:
+        return None
+    return _CALCULATION_FMT(expression=expression, result=calc_result)
+
+
+# Per-tool summary formatters for successful steps in the final response
+SUMMARY_FORMATTERS = {
+    "add_task": _summarize_add_task,
+    "list_tasks": _summarize_list_tasks,
+    "calculate_percentage": _summarize_calculation,
+}
@@ -9,18 +9,70 @@ Based on ChatGPT's NAT-friendly recommendations.
 """
 
 import json
+import re
 import logging
 import asyncio
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 
+import orjson
+
+from executor_tools import SUMMARY_FORMATTERS, TOOLS, load_tool_result
+
 logger = logging.getLogger(__name__)
 
+
+# Tools that mutate shared state; they are ordered against every other step
+_MUTATING_TOOLS = frozenset({"add_task"})
+
+
+def _step_dependencies(steps: List[Dict[str, Any]]) -> List[List[int]]:
+    """Return, for each step, the 0-based indices of the earlier steps it depends on."""
+    deps = []
+    last_mutation = None
+    for i, step in enumerate(steps):
+        if step["tool"] in _MUTATING_TOOLS:
+            # Writes wait for everything before them
+            deps.append(list(range(i)))
+            last_mutation = i
+        elif last_mutation is not None:
+            # Reads must observe the latest write
+            deps.append([last_mutation])
+        else:
+            deps.append([])
+    return deps
+
+
+def _step_levels(deps: List[List[int]]) -> List[List[int]]:
+    """Group step indices into levels whose members can run concurrently."""
+    level_of = []
+    levels: List[List[int]] = []
+    for i, step_deps in enumerate(deps):
+        level = max((level_of[d] + 1 for d in step_deps), default=0)
+        level_of.append(level)
+        if level == len(levels):
+            levels.append([])
+        levels[level].append(i)
+    return levels
+
+
+# Planner intent keywords, matched in one scan over the lowercased request
+_INTENT_KEYWORDS = ("add", "list", "calculate", "%")
+_INTENT_RE = re.compile("|".join(re.escape(kw) for kw in _INTENT_KEYWORDS))
+
+# "X% of Y" percentage request and quoted task name extraction
+_PCT_RE = re.compile(r"(\d+(?:\.\d+)?%)\s+of\s+(\d+(?:\.\d+)?)", re.IGNORECASE)
+_TASK_RE = re.compile(r"'([^']+)'")
+
+
 class PlannerExecutorAgent:
     """
     Custom agent that implements the Planner → Executor pattern to eliminate ReAct drift.
     """
     
+    # Tool name → async tool function
+    _TOOLS = TOOLS
+    
     def __init__(self, config_path: str):
         """Initialize the planner-executor agent."""
         # We'll implement this as a proof of concept
@@ -39,47 +91,62 @@ class PlannerExecutorAgent:
         """
         try:
             # Step 1: Create execution plan
-            logger.info(f"🎯 Planning request: {user_request}")
-            plan = await self._create_plan(user_request)
-            logger.info(f"📋 Generated plan: {json.dumps(plan, indent=2)}")
+            logger.info("🎯 Planning request: %s", user_request)
+            plan = self._create_plan(user_request)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("📋 Generated plan: %s", orjson.dumps(plan, option=orjson.OPT_INDENT_2).decode())
             
-            # Step 2: Execute plan step by step
-            results = []
-            for i, step in enumerate(plan["plan"], 1):
-                remaining = len(plan["plan"]) - i + 1
-                logger.info(f"⚡ Executing step {i}/{len(plan['plan'])}: {step['tool']}")
-                
-                result = await self._execute_step(
-                    user_request=user_request,
-                    plan=plan,
-                    step_number=i,
-                    remaining_steps=remaining,
-                    current_step=step,
-                    previous_results=results[-1] if results else None
-                )
-                
-                results.append(result)
-                logger.info(f"✅ Step {i} completed: {step['tool']}")
+            # Step 2: Execute plan
+            results = await self._execute_concurrent(user_request, plan)
             
             # Step 3: Generate final response
-            final_answer = await self._generate_final_response(
+            final_answer = self._generate_final_response(
                 user_request=user_request,
                 plan=plan,
                 results=results
             )
             
-            logger.info(f"🎉 Agent completed successfully")
+            logger.info("🎉 Agent completed successfully")
             return final_answer
             
         except Exception as e:
-            logger.error(f"❌ Agent execution failed: {e}")
-            return json.dumps({
+            logger.error("❌ Agent execution failed: %s", e)
+            return orjson.dumps({
                 "success": False,
                 "error": f"Agent execution failed: {str(e)}",
                 "error_code": "AGENT_EXECUTION_ERROR"
-            })
+            }).decode()
     
-    async def _create_plan(self, user_request: str) -> Dict[str, Any]:
+    async def _execute_concurrent(self, user_request: str, plan: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Execute independent steps concurrently, one dependency level at a time."""
+        steps = plan["plan"]
+        total = len(steps)
+        deps = _step_dependencies(steps)
+        results: List[Optional[Dict[str, Any]]] = [None] * total
+        
+        for level in _step_levels(deps):
+            for i in level:
+                logger.info("⚡ Executing step %d/%d: %s", i + 1, total, steps[i]["tool"])
+            
+            level_results = await asyncio.gather(*[
+                self._execute_step(
+                    user_request=user_request,
+                    plan=plan,
+                    step_number=i + 1,
+                    remaining_steps=total - i,
+                    current_step=steps[i],
+                    previous_results=results[deps[i][-1]] if deps[i] else None
+                )
+                for i in level
+            ])
+            
+            for i, result in zip(level, level_results):
+                results[i] = result
+                logger.info("✅ Step %d completed: %s", i + 1, steps[i]["tool"])
+        
+        return results
+    
+    def _create_plan(self, user_request: str) -> Dict[str, Any]:
         """Create execution plan using planner prompt (JSON only)."""
         
         # Planner system prompt (from config)
@@ -109,24 +176,18 @@ class PlannerExecutorAgent:
         # In real implementation, this would call NAT's LLM
         
         # Parse the user request and create appropriate plan
-        if "add" in user_request.lower() and "list" in user_request.lower() and "calculate" in user_request.lower():
+        found = set(_INTENT_RE.findall(user_request.lower()))
+        if {"add", "list", "calculate"} <= found:
             # Extract task name
-            task_name = "Planner Test"
-            if "'" in user_request:
-                start = user_request.find("'") + 1
-                end = user_request.find("'", start)
-                if end > start:
-                    task_name = user_request[start:end]
+            task_match = _TASK_RE.search(user_request)
+            task_name = task_match.group(1) if task_match else "Planner Test"
             
             # Extract percentage calculation
             percentage_text = "25% of 200"  # default
-            if "%" in user_request:
-                words = user_request.split()
-                for i, word in enumerate(words):
-                    if "%" in word and i < len(words) - 2:
-                        if words[i+1].lower() == "of":
-                            percentage_text = f"{word} of {words[i+2]}"
-                            break
+            if "%" in found:
+                pct_match = _PCT_RE.search(user_request)
+                if pct_match:
+                    percentage_text = f"{pct_match.group(1)} of {pct_match.group(2)}"
             
             plan = {
                 "plan": [
@@ -159,33 +220,20 @@ class PlannerExecutorAgent:
         tool_name = current_step["tool"]
         tool_input = current_step["input"]
         
-        # Import and execute the actual tool functions
-        if tool_name == "add_task":
-            from personal_assistant.tools.tasks import add_task
-            result = await add_task(**tool_input)
-            
-        elif tool_name == "list_tasks":
-            from personal_assistant.tools.tasks import list_tasks
-            result = await list_tasks(**tool_input)
-            
-        elif tool_name == "calculate_percentage":
-            from personal_assistant.tools.calculator import calculate_percentage
-            result = await calculate_percentage(**tool_input)
-            
-        elif tool_name == "current_time":
-            from personal_assistant.tools.datetime_info import get_current_time
-            result = await get_current_time(**tool_input)
-            
+        # Dispatch to the actual tool function
+        handler = self._TOOLS.get(tool_name)
+        if handler is not None:
+            result = await handler(**tool_input)
         else:
-            result = json.dumps({
+            result = {
                 "success": False,
                 "error": f"Unknown tool: {tool_name}",
                 "error_code": "UNKNOWN_TOOL"
-            })
+            }
         
         # Parse the result to extract key information
         try:
-            result_data = json.loads(result)
+            result_data = load_tool_result(result)
             return {
                 "step": step_number,
                 "tool": tool_name,
@@ -202,7 +250,7 @@ class PlannerExecutorAgent:
                 "success": False
             }
     
-    async def _generate_final_response(
+    def _generate_final_response(
         self,
         user_request: str,
         plan: Dict[str, Any],
@@ -210,32 +258,26 @@ class PlannerExecutorAgent:
     ) -> str:
         """Generate final response summarizing all executed steps."""
         
-        success_count = sum(1 for r in results if r.get("success", False))
         total_steps = len(results)
         
-        # Extract key information from results
-        summary_parts = []
+        # Single pass: count successes and extract key information
+        success_count = 0
+        # At most one fragment per step; trimmed to the filled prefix after the loop
+        summary_parts: List[Optional[str]] = [None] * total_steps
+        filled = 0
         
         for result in results:
-            tool = result["tool"]
-            output = result["output"]
+            if not result.get("success", False):
+                continue
             
-            if tool == "add_task" and result["success"]:
-                task_id = output.get("data", {}).get("task_id", "unknown")
-                task_desc = output.get("data", {}).get("description", "unknown")
-                summary_parts.append(f"Added task {task_id}: '{task_desc}'")
-                
-            elif tool == "list_tasks" and result["success"]:
-                # Count tasks from the output
-                message = output.get("message", "")
-                if "tasks" in message.lower():
-                    summary_parts.append("Listed all tasks")
-                    
-            elif tool == "calculate_percentage" and result["success"]:
-                calc_result = output.get("data", {}).get("result")
-                expression = output.get("data", {}).get("expression", "calculation")
-                if calc_result is not None:
-                    summary_parts.append(f"{expression} = {calc_result}")
+            success_count += 1
+            formatter = SUMMARY_FORMATTERS.get(result["tool"])
+            if formatter is not None:
+                part = formatter(result["output"])
+                if part:
+                    summary_parts[filled] = part
+                    filled += 1
+        del summary_parts[filled:]
         
         # Create final response
         if success_count == total_steps:
@@ -12,17 +12,57 @@ Implements:
 Based on ChatGPT's production optimization recommendations.
 """
 
-import json
 import hashlib
+import sys
 import time
 import logging
-from typing import Dict, Any, List, Optional, Set, Tuple
+from collections import OrderedDict
+from typing import Callable, Dict, Any, FrozenSet, List, Optional, Tuple
 from pathlib import Path
-import jsonschema
-from jsonschema import validate, ValidationError
+import fastjsonschema
+import orjson
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 
 logger = logging.getLogger(__name__)
 
+def _canonical_key(data: Any) -> bytes:
+    """Serialize data to canonical (key-sorted) JSON bytes for hashing."""
+    return orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+
+
+# Execution flags for tools missing from the registry: never cached, no idempotency key
+_UNKNOWN_TOOL_META = {"purity": "impure", "cacheable": False, "needs_idempotency": False}
+
+# Structure every registry document must have; checked once at load so requests never see a bad entry
+_REGISTRY_REQUIRED_FIELDS = frozenset({"registry_version", "tool_schema_version", "tools"})
+_validate_registry_document = fastjsonschema.compile({
+    "type": "object",
+    "properties": {
+        "tools": {
+            "type": "object",
+            "additionalProperties": {
+                "type": "object",
+                "required": [
+                    "version", "purity", "parallel_safe", "requires_idempotency_key",
+                    "cache_ttl_s", "input_schema", "output_schema"
+                ],
+                "properties": {
+                    "purity": {"enum": ["pure", "read_only", "impure"]},
+                    "parallel_safe": {"type": "boolean"},
+                    "requires_idempotency_key": {"type": "boolean"},
+                    "cache_ttl_s": {"type": "number", "minimum": 0},
+                    "input_schema": {"type": "object"},
+                    "output_schema": {"type": "object"}
+                }
+            }
+        }
+    }
+}, use_default=False)
+
+# Completed idempotency keys remembered for duplicate detection
+_MAX_IDEMPOTENCY_KEYS = 1000
+
 class ProductionToolRegistry:
     """
     Production-grade tool registry with ChatGPT's hardening features.
@@ -40,28 +80,40 @@ class ProductionToolRegistry:
         self.registry_path = Path(registry_path)
         self.registry_data = self._load_registry()
         self.tool_schemas = self._extract_tool_schemas()
+        self._tool_names: FrozenSet[str] = frozenset(self.tool_schemas)
+        self._tool_meta = self._build_tool_meta()
+        
+        # Flat per-attribute lookups for the hot accessors (one probe, no throwaway {} on a miss)
+        self._purity: Dict[str, str] = {name: info["purity"] for name, info in self.tool_schemas.items()}
+        self._parallel_safe: Dict[str, bool] = {name: info["parallel_safe"] for name, info in self.tool_schemas.items()}
+        self._idempotency_required: Dict[str, bool] = {name: info["requires_idempotency_key"] for name, info in self.tool_schemas.items()}
+        self._cache_ttl: Dict[str, float] = {name: info["cache_ttl_s"] for name, info in self.tool_schemas.items()}
+        self._cache_ttl_ns: Dict[str, int] = {name: int(ttl * 1_000_000_000) for name, ttl in self._cache_ttl.items()}
         
         # Production caches (in-memory for demo, would use Redis in production)
-        self._pure_cache = {}  # Long TTL cache for pure functions
-        self._read_cache = {}  # Short TTL cache for read-only functions
-        self._cache_timestamps = {}
+        # Each entry is (cached_at monotonic ns, result), kept in write order so the oldest is evicted first
+        self._pure_cache: OrderedDict[str, Tuple[int, str]] = OrderedDict()  # Long TTL cache for pure functions
+        self._read_cache: OrderedDict[str, Tuple[int, str]] = OrderedDict()  # Short TTL cache for read-only functions
         
-        # Idempotency tracking
-        self._idempotency_keys = set()
+        # Idempotency tracking (insertion-ordered so the oldest keys are evicted first)
+        self._idempotency_keys: OrderedDict[str, None] = OrderedDict()
         
         logger.info(f"🔧 Loaded tool registry v{self.registry_version} with {len(self.tool_schemas)} tools")
         
     def _load_registry(self) -> Dict[str, Any]:
         """Load and validate the tool registry."""
         try:
-            with open(self.registry_path, 'r') as f:
-                registry = json.load(f)
-                
-            # Basic registry validation
-            required_fields = ["registry_version", "tool_schema_version", "tools"]
-            for field in required_fields:
-                if field not in registry:
-                    raise ValueError(f"Registry missing required field: {field}")
+            registry = orjson.loads(self.registry_path.read_bytes())
+            
+            # Basic registry validation, reporting every missing field at once
+            missing = _REGISTRY_REQUIRED_FIELDS - registry.keys()
+            if missing:
+                raise ValueError(f"Registry missing required fields: {sorted(missing)}")
+            
+            try:
+                _validate_registry_document(registry)
+            except fastjsonschema.JsonSchemaValueException as e:
+                raise ValueError(f"Invalid tool registry: {e.message}") from e
                     
             logger.info(f"✅ Registry validation passed: {len(registry['tools'])} tools loaded")
             return registry
@@ -71,20 +123,69 @@ class ProductionToolRegistry:
             raise
     
     def _extract_tool_schemas(self) -> Dict[str, Dict[str, Any]]:
-        """Extract tool metadata and schemas for runtime use."""
+        """Extract tool metadata and schemas, compiling validators once for runtime use."""
         tools = {}
         for tool_name, tool_config in self.registry_data["tools"].items():
-            tools[tool_name] = {
+            input_validator = self._compile_validator(tool_config["input_schema"])
+            # Interned so lookups with interned plan tool names and purity literals hit on identity
+            tools[sys.intern(tool_name)] = {
                 "version": tool_config["version"],
-                "purity": tool_config["purity"], 
+                "purity": sys.intern(tool_config["purity"]), 
                 "parallel_safe": tool_config["parallel_safe"],
                 "requires_idempotency_key": tool_config["requires_idempotency_key"],
                 "cache_ttl_s": tool_config["cache_ttl_s"],
                 "input_schema": tool_config["input_schema"],
-                "output_schema": tool_config["output_schema"]
+                "output_schema": tool_config["output_schema"],
+                "input_validator": input_validator,
+                # No-argument calls are common (e.g. list_tasks); decide their validity once here
+                "accepts_empty": input_validator({}) is None
             }
         return tools
     
+    @staticmethod
+    def _compile_validator(schema: Dict[str, Any]) -> Callable[[Any], Optional[str]]:
+        """
+        Check a schema and build a reusable checker for it.
+        
+        The checker returns the validation error message, or None when the instance is valid.
+        Schemas are compiled to Python with fastjsonschema; jsonschema's interpreter is the
+        fallback for keywords fastjsonschema cannot compile.
+        """
+        validator_cls = validator_for(schema)
+        validator_cls.check_schema(schema)
+        
+        try:
+            # use_default=False: validation must never write defaults into the caller's input
+            compiled = fastjsonschema.compile(schema, use_default=False)
+        except fastjsonschema.JsonSchemaDefinitionException:
+            validator = validator_cls(schema)
+            
+            def check(instance: Any) -> Optional[str]:
+                error = best_match(validator.iter_errors(instance))
+                return None if error is None else error.message
+            
+            return check
+        
+        def check(instance: Any) -> Optional[str]:
+            try:
+                compiled(instance)
+            except fastjsonschema.JsonSchemaValueException as e:
+                return e.message
+            return None
+        
+        return check
+    
+    def _build_tool_meta(self) -> Dict[str, Dict[str, Any]]:
+        """Precompute the per-tool flags the executor checks on every step."""
+        meta = {}
+        for tool_name, tool_info in self.tool_schemas.items():
+            meta[tool_name] = {
+                "purity": tool_info["purity"],
+                "cacheable": tool_info["cache_ttl_s"] > 0 and tool_info["purity"] in ("pure", "read_only"),
+                "needs_idempotency": bool(tool_info["requires_idempotency_key"])
+            }
+        return meta
+    
     @property
     def registry_version(self) -> str:
         """Get the registry version for cache invalidation."""
@@ -100,6 +201,11 @@ class ProductionToolRegistry:
         """Get list of all available tool names."""
         return list(self.tool_schemas.keys())
     
+    @property
+    def available_tools_set(self) -> FrozenSet[str]:
+        """Get all available tool names as a frozenset (no per-call allocation)."""
+        return self._tool_names
+    
     def validate_tool_input(self, tool_name: str, tool_input: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
         """
         Validate tool input against its schema.
@@ -107,38 +213,45 @@ class ProductionToolRegistry:
         Returns:
             (is_valid, error_message)
         """
-        if tool_name not in self.tool_schemas:
+        if tool_name not in self._tool_names:
             return False, f"Unknown tool: {tool_name}"
+        tool_info = self.tool_schemas[tool_name]
+        if type(tool_input) is dict and not tool_input and tool_info["accepts_empty"]:
+            return True, None
         
         try:
-            schema = self.tool_schemas[tool_name]["input_schema"]
-            validate(instance=tool_input, schema=schema)
-            return True, None
+            error = tool_info["input_validator"](tool_input)
+            if error is None:
+                return True, None
             
-        except ValidationError as e:
-            error_msg = f"Input validation failed for {tool_name}: {e.message}"
+            error_msg = f"Input validation failed for {tool_name}: {error}"
             logger.warning(f"⚠️ {error_msg}")
             return False, error_msg
+            
         except Exception as e:
             error_msg = f"Schema validation error for {tool_name}: {str(e)}"
             logger.error(f"❌ {error_msg}")
             return False, error_msg
     
+    def get_tool_meta(self, tool_name: str) -> Dict[str, Any]:
+        """Get precomputed execution flags (purity, cacheable, needs_idempotency) for a tool."""
+        return self._tool_meta.get(tool_name, _UNKNOWN_TOOL_META)
+    
     def get_tool_purity(self, tool_name: str) -> str:
         """Get tool purity level (pure, read_only, impure)."""
-        return self.tool_schemas.get(tool_name, {}).get("purity", "impure")
+        return self._purity.get(tool_name, "impure")
     
     def is_parallel_safe(self, tool_name: str) -> bool:
         """Check if tool can be run in parallel."""
-        return self.tool_schemas.get(tool_name, {}).get("parallel_safe", False)
+        return self._parallel_safe.get(tool_name, False)
     
     def requires_idempotency_key(self, tool_name: str) -> bool:
         """Check if tool requires idempotency key for retry safety."""
-        return self.tool_schemas.get(tool_name, {}).get("requires_idempotency_key", False)
+        return self._idempotency_required.get(tool_name, False)
     
     def get_cache_ttl(self, tool_name: str) -> float:
         """Get cache TTL for tool in seconds."""
-        return self.tool_schemas.get(tool_name, {}).get("cache_ttl_s", 0)
+        return self._cache_ttl.get(tool_name, 0)
     
     def generate_idempotency_key(self, user_request: str, step_number: int, tool_name: str, tool_input: Dict[str, Any]) -> str:
         """
@@ -162,8 +275,8 @@ class ProductionToolRegistry:
             "registry_version": self.registry_version
         }
         
-        key_string = json.dumps(key_data, sort_keys=True)
-        key_hash = hashlib.sha256(key_string.encode()).hexdigest()[:16]  # 16 chars for readability
+        # Non-cryptographic use: BLAKE2b sized to the 16 hex chars we keep
+        key_hash = hashlib.blake2b(_canonical_key(key_data), digest_size=8).hexdigest()
         
         return f"idem_{key_hash}"
     
@@ -173,15 +286,13 @@ class ProductionToolRegistry:
     
     def mark_operation_complete(self, idempotency_key: str) -> None:
         """Mark operation as completed for idempotency tracking."""
-        self._idempotency_keys.add(idempotency_key)
+        self._idempotency_keys[idempotency_key] = None
         
         # Cleanup old keys (keep only last 1000 for memory management)
-        if len(self._idempotency_keys) > 1000:
-            old_keys = list(self._idempotency_keys)[:500]
-            for key in old_keys:
-                self._idempotency_keys.discard(key)
+        while len(self._idempotency_keys) > _MAX_IDEMPOTENCY_KEYS:
+            self._idempotency_keys.popitem(last=False)
     
-    def get_cached_result(self, tool_name: str, tool_input: Dict[str, Any]) -> Optional[str]:
+    def get_cached_result(self, tool_name: str, tool_input: Dict[str, Any], cache_key: Optional[str] = None) -> Optional[str]:
         """
         Get cached result for tool execution.
         
@@ -189,15 +300,18 @@ class ProductionToolRegistry:
         - pure functions: long TTL (86400s)
         - read_only functions: short TTL (0.5-2s) 
         - impure functions: no caching (TTL 0)
+        
+        Pass cache_key from generate_cache_key() to reuse it for the later cache_result() call.
         """
         purity = self.get_tool_purity(tool_name)
-        cache_ttl = self.get_cache_ttl(tool_name)
+        cache_ttl_ns = self._cache_ttl_ns.get(tool_name, 0)
         
-        if cache_ttl == 0:  # No caching for impure tools
+        if cache_ttl_ns == 0:  # No caching for impure tools
             return None
         
-        # Generate cache key
-        cache_key = self._generate_cache_key(tool_name, tool_input)
+        # Generate cache key unless the caller already has it
+        if cache_key is None:
+            cache_key = self.generate_cache_key(tool_name, tool_input)
         
         # Select appropriate cache based on purity
         if purity == "pure":
@@ -208,22 +322,23 @@ class ProductionToolRegistry:
             return None  # No caching for impure
         
         # Check if cached result exists and is fresh
-        if cache_key in cache:
-            cached_time = self._cache_timestamps.get(cache_key, 0)
-            age = time.time() - cached_time
+        entry = cache.get(cache_key)
+        if entry is not None:
+            cached_at_ns, cached_value = entry
+            # Monotonic clock: ages are immune to wall-clock (NTP) adjustments
+            age_ns = time.monotonic_ns() - cached_at_ns
             
-            if age <= cache_ttl:
-                logger.debug(f"📦 Cache hit for {tool_name} (age: {age:.2f}s)")
-                return cache[cache_key]
+            if age_ns <= cache_ttl_ns:
+                logger.debug("📦 Cache hit for %s (age: %.2fs)", tool_name, age_ns / 1e9)
+                return cached_value
             else:
                 # Expired - remove from cache
-                cache.pop(cache_key, None)
-                self._cache_timestamps.pop(cache_key, None)
-                logger.debug(f"⏰ Cache expired for {tool_name} (age: {age:.2f}s)")
+                del cache[cache_key]
+                logger.debug("⏰ Cache expired for %s (age: %.2fs)", tool_name, age_ns / 1e9)
         
         return None
     
-    def cache_result(self, tool_name: str, tool_input: Dict[str, Any], result: str) -> None:
+    def cache_result(self, tool_name: str, tool_input: Dict[str, Any], result: str, cache_key: Optional[str] = None) -> None:
         """Cache tool result according to purity-based caching strategy."""
         purity = self.get_tool_purity(tool_name)
         cache_ttl = self.get_cache_ttl(tool_name)
@@ -231,8 +346,9 @@ class ProductionToolRegistry:
         if cache_ttl == 0:  # No caching for impure tools
             return
         
-        # Generate cache key
-        cache_key = self._generate_cache_key(tool_name, tool_input)
+        # Generate cache key unless the caller already has it
+        if cache_key is None:
+            cache_key = self.generate_cache_key(tool_name, tool_input)
         
         # Select appropriate cache based on purity
         if purity == "pure":
@@ -242,22 +358,18 @@ class ProductionToolRegistry:
         else:
             return  # No caching for impure
         
-        # Store result with timestamp
-        cache[cache_key] = result
-        self._cache_timestamps[cache_key] = time.time()
+        # Store result with timestamp; a rewrite becomes the newest entry
+        cache[cache_key] = (time.monotonic_ns(), result)
+        cache.move_to_end(cache_key)
         
         logger.debug(f"💾 Cached result for {tool_name} (TTL: {cache_ttl}s)")
         
-        # Memory management - limit cache sizes
+        # Memory management - limit cache sizes by evicting the oldest entries
         max_cache_size = 10000 if purity == "pure" else 1000
-        if len(cache) > max_cache_size:
-            # Remove oldest entries
-            sorted_keys = sorted(cache.keys(), key=lambda k: self._cache_timestamps.get(k, 0))
-            for key in sorted_keys[:max_cache_size // 2]:
-                cache.pop(key, None)
-                self._cache_timestamps.pop(key, None)
-    
-    def _generate_cache_key(self, tool_name: str, tool_input: Dict[str, Any]) -> str:
+        while len(cache) > max_cache_size:
+            cache.popitem(last=False)
+    
+    def generate_cache_key(self, tool_name: str, tool_input: Dict[str, Any]) -> str:
         """Generate deterministic cache key for tool + input."""
         key_data = {
             "tool": tool_name,
@@ -265,14 +377,12 @@ class ProductionToolRegistry:
             "schema_version": self.tool_schema_version
         }
         
-        key_string = json.dumps(key_data, sort_keys=True)
-        return hashlib.sha256(key_string.encode()).hexdigest()[:32]  # 32 chars for uniqueness
+        return hashlib.blake2b(_canonical_key(key_data), digest_size=16).hexdigest()  # 32 chars for uniqueness
     
     def invalidate_caches(self) -> None:
         """Invalidate all caches (call when registry/tools change)."""
         self._pure_cache.clear()
         self._read_cache.clear()
-        self._cache_timestamps.clear()
         logger.info("🧹 All tool caches invalidated")
     
     def normalize_plan(self, plan: Dict[str, Any]) -> Dict[str, Any]:
@@ -283,63 +393,71 @@ class ProductionToolRegistry:
         3. Move pure calcs after required impure reads if they don't feed each other
         4. Cap steps at 12 max
         """
+        return self.normalize_plan_with_keys(plan)[0]
+    
+    def normalize_plan_with_keys(self, plan: Dict[str, Any]) -> Tuple[Dict[str, Any], List[Optional[str]]]:
+        """
+        Normalize plan as normalize_plan() does and also return each normalized step's cache key.
+        
+        The keys list is parallel to the normalized plan's steps (None for impure steps), so the
+        executor's cache lookup can reuse them instead of hashing the input again. The caller's
+        step dicts are left untouched.
+        """
         original_steps = plan["plan"]
         
         if len(original_steps) == 0:
-            return plan
+            return plan, []
         
-        normalized_steps = []
+        # Single pass: collapse duplicate reads (rules 1 & 2) and bucket by purity for rule 3
+        purity_of = self._purity
+        # Each bucket holds (step, cache_key) pairs
+        impure_steps = []
+        pure_steps = []
+        read_steps = []
+        buckets = {"impure": impure_steps, "pure": pure_steps}  # anything else is read_only
         
-        # Rule 1 & 2: Collapse consecutive identical reads
-        prev_step = None
+        prev_key = None
         for step in original_steps:
-            tool_name = step["tool"]
-            tool_input = step["input"]
-            purity = self.get_tool_purity(tool_name)
+            # Copy so renumbering and interning never touch the planner's plan
+            tool_name = sys.intern(step["tool"])
+            step = {**step, "tool": tool_name}
+            purity = purity_of.get(tool_name, "impure")
+            
+            # Canonical (tool, input) key for non-impure steps
+            key = None
+            if purity != "impure":
+                key = self.generate_cache_key(tool_name, step["input"])
             
             # Skip if identical to previous read-only operation
-            if (prev_step and 
-                purity == "read_only" and 
-                prev_step["tool"] == tool_name and
-                prev_step["input"] == tool_input):
+            if purity == "read_only" and key == prev_key:
                 logger.info(f"🔧 Collapsed duplicate {tool_name} operation")
                 continue
             
-            normalized_steps.append(step)
-            prev_step = step
-        
-        # Rule 3: Move pure calculations after impure operations (basic reordering)
-        impure_steps = []
-        pure_steps = []
-        read_steps = []
-        
-        for step in normalized_steps:
-            purity = self.get_tool_purity(step["tool"])
-            if purity == "impure":
-                impure_steps.append(step)
-            elif purity == "pure":
-                pure_steps.append(step)
-            else:  # read_only
-                read_steps.append(step)
+            buckets.get(purity, read_steps).append((step, key))
+            prev_key = key
         
         # Reorder: impure → read_only → pure (preserving relative order within each group)
-        reordered_steps = impure_steps + read_steps + pure_steps
+        reordered = impure_steps + read_steps + pure_steps
         
         # Rule 4: Cap at 12 steps max
-        if len(reordered_steps) > 12:
-            logger.warning(f"⚠️ Plan has {len(reordered_steps)} steps, capping at 12")
-            reordered_steps = reordered_steps[:12]
+        if len(reordered) > 12:
+            logger.warning(f"⚠️ Plan has {len(reordered)} steps, capping at 12")
+            reordered = reordered[:12]
         
         # Renumber steps
-        for i, step in enumerate(reordered_steps, 1):
+        reordered_steps = []
+        cache_keys = []
+        for i, (step, key) in enumerate(reordered, 1):
             step["step"] = i
+            reordered_steps.append(step)
+            cache_keys.append(key)
         
         normalized_plan = {"plan": reordered_steps}
         
         if len(reordered_steps) != len(original_steps):
             logger.info(f"🔧 Plan normalized: {len(original_steps)} → {len(reordered_steps)} steps")
         
-        return normalized_plan
+        return normalized_plan, cache_keys
     
     def get_parallel_execution_groups(self, plan: Dict[str, Any]) -> List[List[Dict[str, Any]]]:
         """
@@ -349,15 +467,17 @@ class ProductionToolRegistry:
         Only groups parallel_safe=true tools together.
         """
         steps = plan["plan"]
+        parallel_safe = self._parallel_safe
         execution_groups = []
         current_group = []
+        # A group only ever grows with safe steps, so it is all-safe iff its first step is
+        current_safe = False
         
         for step in steps:
-            tool_name = step["tool"]
-            is_safe = self.is_parallel_safe(tool_name)
+            is_safe = parallel_safe.get(step["tool"], False)
             
             # If current step is parallel safe and we have other parallel safe steps, add to group
-            if is_safe and current_group and all(self.is_parallel_safe(s["tool"]) for s in current_group):
+            if is_safe and current_group and current_safe:
                 current_group.append(step)
                 
                 # Limit group size to 3 for resource management
@@ -369,14 +489,15 @@ class ProductionToolRegistry:
                 if current_group:
                     execution_groups.append(current_group)
                 current_group = [step]
+                current_safe = is_safe
         
         # Add final group
         if current_group:
             execution_groups.append(current_group)
         
-        parallel_groups = [group for group in execution_groups if len(group) > 1]
-        if parallel_groups:
-            logger.info(f"⚡ Plan allows {len(parallel_groups)} parallel execution groups")
+        n_parallel = sum(1 for group in execution_groups if len(group) > 1)
+        if n_parallel:
+            logger.info("⚡ Plan allows %d parallel execution groups", n_parallel)
         
         return execution_groups
     
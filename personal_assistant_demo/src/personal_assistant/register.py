@@ -15,533 +15,278 @@
 
 """Function registration for the Personal Assistant Demo."""
 
+import functools
+import importlib
 import logging
+import types
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Any, Callable, Dict, Tuple, Type
 
 from nat.builder.builder import Builder
 from nat.builder.function_info import FunctionInfo
 from nat.cli.register_workflow import register_function
 from nat.data_models.function import FunctionBaseConfig
 
-# Weather tools commented out - uncomment and add OPENWEATHER_API_KEY to use
-# from .tools.weather import get_weather_info, check_weather_condition
-from .tools.tasks import add_task, list_tasks, complete_task, delete_task, list_tasks_for_client, add_client_task, assign_random_clients_to_unassigned_tasks
-from .tools.calculator import add_numbers, subtract_numbers, multiply_numbers, divide_numbers, calculate_percentage
-from .tools.datetime_info import (
-    get_current_time, get_current_date,
-    get_timezone_info, calculate_time_difference, get_day_of_week, get_current_hour
-)
-# Enterprise tools for solutions architect showcase
-from .tools.meeting_scheduler import schedule_meeting, list_meetings, cancel_meeting
-from .tools.client_management import add_client, list_clients, add_client_note, get_client_details, find_client_by_name, update_client_email
+# Tool callables are resolved on first use rather than imported here: NAT
+# imports this module for every workflow, and most workflows only enable a
+# handful of tools.  Weather tools (get_weather_info, check_weather_condition)
+# are commented out below - add them here with an OPENWEATHER_API_KEY to use.
+_TOOL_MODULES: Dict[str, str] = {
+    # Task management
+    "add_task": ".tools.tasks",
+    "list_tasks": ".tools.tasks",
+    "complete_task": ".tools.tasks",
+    "delete_task": ".tools.tasks",
+    "list_tasks_for_client": ".tools.tasks",
+    "add_client_task": ".tools.tasks",
+    "assign_random_clients_to_unassigned_tasks": ".tools.tasks",
+    # Calculator
+    "add_numbers": ".tools.calculator",
+    "subtract_numbers": ".tools.calculator",
+    "multiply_numbers": ".tools.calculator",
+    "divide_numbers": ".tools.calculator",
+    "calculate_percentage": ".tools.calculator",
+    # Date/time
+    "get_current_time": ".tools.datetime_info",
+    "get_current_date": ".tools.datetime_info",
+    "get_timezone_info": ".tools.datetime_info",
+    "calculate_time_difference": ".tools.datetime_info",
+    "get_day_of_week": ".tools.datetime_info",
+    "get_current_hour": ".tools.datetime_info",
+    # Enterprise tools for solutions architect showcase
+    "schedule_meeting": ".tools.meeting_scheduler",
+    "list_meetings": ".tools.meeting_scheduler",
+    "cancel_meeting": ".tools.meeting_scheduler",
+    "add_client": ".tools.client_management",
+    "list_clients": ".tools.client_management",
+    "add_client_note": ".tools.client_management",
+    "get_client_details": ".tools.client_management",
+    "find_client_by_name": ".tools.client_management",
+    "update_client_email": ".tools.client_management",
+}
+_loaded_modules: Dict[str, ModuleType] = {}
 
 
 logger = logging.getLogger(__name__)
 
 
-# Weather Tools - Commented out (uncomment and add OPENWEATHER_API_KEY to use)
-# class WeatherInfoConfig(FunctionBaseConfig, name="weather_info"):
-#     pass
-
-
-# @register_function(config_type=WeatherInfoConfig)
-# async def weather_info(config: WeatherInfoConfig, builder: Builder):
-#     """Get current weather information for a city."""
-#     yield FunctionInfo.from_fn(
-#         get_weather_info,
-#         description=(
-#             "Get current weather information for any city. "
-#             "Provide the city name and get temperature, conditions, and humidity. "
-#             "Example: 'What's the weather in New York?'"
-#         )
-#     )
-
-
-# class WeatherConditionConfig(FunctionBaseConfig, name="weather_condition"):
-#     pass
-
-
-# @register_function(config_type=WeatherConditionConfig)
-# async def weather_condition(config: WeatherConditionConfig, builder: Builder):
-#     """Check for specific weather conditions in a city."""
-#     yield FunctionInfo.from_fn(
-#         check_weather_condition,
-#         description=(
-#             "Check if a specific weather condition exists in a city. "
-#             "Useful for questions like 'Is it raining in London?' or 'Is it sunny in Miami?'"
-#         )
-#     )
-
-
-# Task Management Tools
-class AddTaskConfig(FunctionBaseConfig, name="add_task"):
-    pass
-
-
-@register_function(config_type=AddTaskConfig)
-async def add_task_function(config: AddTaskConfig, builder: Builder):
-    """Add a new task to the task list."""
-    yield FunctionInfo.from_fn(
-        add_task,
-        description=(
-            "Add a new task to your personal task list. This tool is ALWAYS available for task creation. "
-            "Can be used independently or as part of multi-step workflows. "
-            "Example: 'Add a task to follow up with Sarah Johnson next week'"
-        )
-    )
-
-
-class ListTasksConfig(FunctionBaseConfig, name="list_tasks"):
-    pass
-
-
-@register_function(config_type=ListTasksConfig)
-async def list_tasks_function(config: ListTasksConfig, builder: Builder):
-    """List tasks with intelligent filtering based on user requests."""
-    yield FunctionInfo.from_fn(
-        list_tasks,
-        description=(
-            "List tasks with flexible filtering. Extract filter parameters from natural language:\n"
-            "- 'show all tasks' → list_tasks() [default: shows all]\n"
-            "- 'show completed tasks' → list_tasks(status='completed')\n"
-            "- 'show pending tasks' → list_tasks(status='pending')\n"
-            "- 'tasks for Sarah Johnson' → list_tasks(client_name='Sarah Johnson')\n" 
-            "- 'completed tasks for Alex' → list_tasks(status='completed', client_name='Alex Chen')\n"
-            "- 'find urgent tasks' → list_tasks(query='urgent')\n"
-            "The LLM should intelligently map user requests to appropriate parameters. "
-            "Status options: 'completed', 'pending', or '' for all."
-        )
-    )
-
-
-class CompleteTaskConfig(FunctionBaseConfig, name="complete_task"):
-    pass
-
-
-@register_function(config_type=CompleteTaskConfig)
-async def complete_task_function(config: CompleteTaskConfig, builder: Builder):
-    """Mark a task as completed."""
-    yield FunctionInfo.from_fn(
-        complete_task,
-        description=(
-            "Mark a task as completed. You can specify the task by its ID number or by part of its description. "
-            "Example: 'Complete task 1' or 'Mark the grocery task as done'"
-        )
-    )
-
-
-class DeleteTaskConfig(FunctionBaseConfig, name="delete_task"):
-    pass
-
-
-@register_function(config_type=DeleteTaskConfig)
-async def delete_task_function(config: DeleteTaskConfig, builder: Builder):
-    """Delete a task from the task list."""
-    yield FunctionInfo.from_fn(
-        delete_task,
-        description=(
-            "Delete a task from your task list. You can specify the task by its ID number or by part of its description. "
-            "Example: 'Delete task 1' or 'Remove the grocery task'"
-        )
-    )
-
-
-class ListTasksForClientConfig(FunctionBaseConfig, name="list_tasks_for_client"):
-    pass
-
-
-@register_function(config_type=ListTasksForClientConfig)
-async def list_tasks_for_client_function(config: ListTasksForClientConfig, builder: Builder):
-    """List all tasks for a specific client."""
-    yield FunctionInfo.from_fn(
-        list_tasks_for_client,
-        description=(
-            "List all tasks associated with a specific client. Shows both pending and completed tasks for that client. "
-            "Example: 'List tasks for Alex Chen' or 'Show all tasks for Microsoft'"
-        )
-    )
-
-
-class AddClientTaskConfig(FunctionBaseConfig, name="add_client_task"):
-    pass
-
-
-@register_function(config_type=AddClientTaskConfig)
-async def add_client_task_function(config: AddClientTaskConfig, builder: Builder):
-    """Add a task for a specific client."""
-    yield FunctionInfo.from_fn(
-        add_client_task,
-        description=(
-            "Add a task associated with a specific client. Automatically links the task to the client for better organization. "
-            "Example: 'Add task for Microsoft: Review GPU cluster requirements' or 'Create task for Alex Chen to follow up on project'"
-        )
-    )
-
-
-class AssignRandomClientsConfig(FunctionBaseConfig, name="assign_random_clients"):
-    pass
-
-
-@register_function(config_type=AssignRandomClientsConfig)
-async def assign_random_clients_function(config: AssignRandomClientsConfig, builder: Builder):
-    """Assign random clients to tasks that don't have specific client assignments."""
-    yield FunctionInfo.from_fn(
-        assign_random_clients_to_unassigned_tasks,
-        description=(
-            "Assign random clients to all tasks that do not have a specific client name associated with them. "
-            "This helps ensure better task organization and client relationship management. "
-            "Use this when you notice tasks without client assignments or when asked to organize tasks by clients."
-        )
-    )
-
-
-# Calculator Tools
-class AddNumbersConfig(FunctionBaseConfig, name="add_numbers"):
-    pass
-
-
-@register_function(config_type=AddNumbersConfig)
-async def add_numbers_function(config: AddNumbersConfig, builder: Builder):
-    """Add two or more numbers together."""
-    yield FunctionInfo.from_fn(
-        add_numbers,
-        description=(
-            "Add two or more numbers together. "
-            "Example: 'Add 25 and 37' or 'What's 10 + 20 + 30?'"
-        )
-    )
-
-
-class SubtractNumbersConfig(FunctionBaseConfig, name="subtract_numbers"):
-    pass
-
-
-@register_function(config_type=SubtractNumbersConfig)
-async def subtract_numbers_function(config: SubtractNumbersConfig, builder: Builder):
-    """Subtract one number from another."""
-    yield FunctionInfo.from_fn(
-        subtract_numbers,
-        description=(
-            "Subtract the second number from the first number. "
-            "Example: 'Subtract 15 from 50' or 'What's 100 - 25?'"
-        )
-    )
-
-
-class MultiplyNumbersConfig(FunctionBaseConfig, name="multiply_numbers"):
-    pass
-
-
-@register_function(config_type=MultiplyNumbersConfig)
-async def multiply_numbers_function(config: MultiplyNumbersConfig, builder: Builder):
-    """Multiply two or more numbers together."""
-    yield FunctionInfo.from_fn(
-        multiply_numbers,
-        description=(
-            "Multiply two or more numbers together. "
-            "Example: 'Multiply 8 by 7' or 'What's 5 × 4 × 3?'"
-        )
-    )
-
-
-class DivideNumbersConfig(FunctionBaseConfig, name="divide_numbers"):
-    pass
-
-
-@register_function(config_type=DivideNumbersConfig)
-async def divide_numbers_function(config: DivideNumbersConfig, builder: Builder):
-    """Divide one number by another."""
-    yield FunctionInfo.from_fn(
-        divide_numbers,
-        description=(
-            "Divide the first number by the second number. "
-            "Example: 'Divide 100 by 4' or 'What's 50 ÷ 2?'"
-        )
-    )
-
-
-# Percentage calculator function - required for demo step 4
-class CalculatePercentageConfig(FunctionBaseConfig, name="calculate_percentage"):
-    pass
-
-
-@register_function(config_type=CalculatePercentageConfig)
-async def calculate_percentage_function(config: CalculatePercentageConfig, builder: Builder):
-    """Calculate a percentage of a number."""
-    yield FunctionInfo.from_fn(
-        calculate_percentage,
-        description=(
-            "Calculate a percentage of a number for financial and business calculations. "
-            "Always available for percentage calculations like '15% of 50000' or 'What's 20 percent of 150?'. "
-            "Essential for budget calculations and business intelligence."
-        )
-    )
-
-
-# Date/Time Tools
-class CurrentTimeConfig(FunctionBaseConfig, name="current_time"):
-    pass
-
-
-@register_function(config_type=CurrentTimeConfig)
-async def current_time_function(config: CurrentTimeConfig, builder: Builder):
-    """Get the current time."""
-    yield FunctionInfo.from_fn(
-        get_current_time,
-        description=(
-            "Get the current time in 12-hour format with AM/PM. "
-            "Example: 'What time is it?' or 'Tell me the current time'"
-        )
-    )
-
-
-class CurrentDateConfig(FunctionBaseConfig, name="current_date"):
-    pass
-
-
-@register_function(config_type=CurrentDateConfig)
-async def current_date_function(config: CurrentDateConfig, builder: Builder):
-    """Get the current date."""
-    yield FunctionInfo.from_fn(
-        get_current_date,
-        description=(
-            "Get the current date with day of week, month, day, and year. "
-            "Example: 'What's today's date?' or 'What day is it?'"
-        )
-    )
-
-
-# Additional datetime functions - uncomment if needed
-# class TimezoneInfoConfig(FunctionBaseConfig, name="timezone_info"):
-#     pass
-
-
-# @register_function(config_type=TimezoneInfoConfig)
-# async def timezone_info_function(config: TimezoneInfoConfig, builder: Builder):
-#     """Get timezone information."""
-#     yield FunctionInfo.from_fn(
-#         get_timezone_info,
-#         description=(
-#             "Get information about the current timezone including name and UTC offset. "
-#             "Example: 'What timezone am I in?' or 'What's my timezone?'"
-#         )
-#     )
-
-
-# class TimeDifferenceConfig(FunctionBaseConfig, name="time_difference"):
-#     pass
-
-
-# @register_function(config_type=TimeDifferenceConfig)
-# async def time_difference_function(config: TimeDifferenceConfig, builder: Builder):
-#     """Calculate time after adding or subtracting hours."""
-#     yield FunctionInfo.from_fn(
-#         calculate_time_difference,
-#         description=(
-#             "Calculate what time it will be after adding or subtracting hours from now. "
-#             "Example: 'What time will it be in 3 hours?' or 'What time was it 2 hours ago?'"
-#         )
-#     )
-
-
-# class DayOfWeekConfig(FunctionBaseConfig, name="day_of_week"):
-#     pass
-
-
-# @register_function(config_type=DayOfWeekConfig)
-# async def day_of_week_function(config: DayOfWeekConfig, builder: Builder):
-#     """Get the current day of the week."""
-#     yield FunctionInfo.from_fn(
-#         get_day_of_week,
-#         description=(
-#             "Get the current day of the week. "
-#             "Example: 'What day is today?' or 'What day of the week is it?'"
-#         )
-#     )
-
-
-# class CurrentHourConfig(FunctionBaseConfig, name="current_hour"):
-#     pass
-
-
-# @register_function(config_type=CurrentHourConfig)
-# async def current_hour_function(config: CurrentHourConfig, builder: Builder):
-#     """Get the current hour in 24-hour format."""
-#     yield FunctionInfo.from_fn(
-#         get_current_hour,
-#         description=(
-#             "Get the current hour in 24-hour format (0-23). "
-#             "Useful for time-based comparisons and calculations."
-#         )
-#     )
-
-
-# Enterprise Tools for Solutions Architect Showcase
-
-# Meeting Scheduler Tools
-class ScheduleMeetingConfig(FunctionBaseConfig, name="schedule_meeting"):
-    pass
-
-
-@register_function(config_type=ScheduleMeetingConfig)
-async def schedule_meeting_function(config: ScheduleMeetingConfig, builder: Builder):
-    """Schedule a meeting with specified details."""
-    yield FunctionInfo.from_fn(
-        schedule_meeting,
-        description=(
-            "Schedule a meeting with specified participants and timing details. "
-            "This tool is ALWAYS available for scheduling meetings. "
-            "Accepts natural language times like 'tomorrow at 3 PM' and participant names. "
-            "Example: 'Schedule a meeting with Sarah Johnson tomorrow at 3 PM for 90 minutes'"
-        )
-    )
-
-
-class ListMeetingsConfig(FunctionBaseConfig, name="list_meetings"):
-    pass
-
-
-@register_function(config_type=ListMeetingsConfig)
-async def list_meetings_function(config: ListMeetingsConfig, builder: Builder):
-    """List all scheduled meetings with filtering options."""
-    yield FunctionInfo.from_fn(
-        list_meetings,
-        description=(
-            "List all scheduled meetings. This tool is ALWAYS available for retrieving meeting information. "
-            "Can be used independently or as part of multi-step workflows. "
-            "Example: 'List all meetings' or 'Show me my meetings'"
-        )
-    )
-
-
-class CancelMeetingConfig(FunctionBaseConfig, name="cancel_meeting"):
-    pass
-
-
-@register_function(config_type=CancelMeetingConfig)
-async def cancel_meeting_function(config: CancelMeetingConfig, builder: Builder):
-    """Cancel a scheduled meeting by ID."""
-    yield FunctionInfo.from_fn(
-        cancel_meeting,
-        description=(
-            "Cancel a scheduled meeting by ID with optional reason. "
-            "Includes automatic notification simulation for participants. "
-            "Example: 'Cancel meeting 1' or 'Cancel the 2 PM meeting'"
-        )
-    )
-
-
-# Client Management Tools
-class AddClientConfig(FunctionBaseConfig, name="add_client"):
-    pass
-
-
-@register_function(config_type=AddClientConfig)
-async def add_client_function(config: AddClientConfig, builder: Builder):
-    """Add a new client to the CRM system."""
-    yield FunctionInfo.from_fn(
-        add_client,
-        description=(
-            "Add a new client with contact information, company details, and project requirements. "
-            "Essential for solutions architect client relationship management. "
-            "Example: 'Add client John Smith from TechCorp with email john@techcorp.com'"
-        )
-    )
-
-
-class ListClientsConfig(FunctionBaseConfig, name="list_clients"):
-    pass
-
-
-@register_function(config_type=ListClientsConfig)
-async def list_clients_function(config: ListClientsConfig, builder: Builder):
-    """List all clients with filtering options."""
-    yield FunctionInfo.from_fn(
-        list_clients,
-        description=(
-            "List all clients in the CRM system. By default shows ALL clients unless specifically asked to filter. "
-            "IMPORTANT: Only use filters parameter if the user specifically asks for filtering by priority. "
-            "FILTERS: Use 'high', 'medium', 'low', or 'active' only when explicitly requested. "
-            "Examples: "
-            "- 'List all clients' → list_clients('') or list_clients() - shows ALL 13 clients "
-            "- 'Show high priority clients only' → list_clients('high') "
-            "- 'Show medium priority clients' → list_clients('medium') "
-            "- 'Show active clients only' → list_clients('active')"
-        )
-    )
-
-
-class AddClientNoteConfig(FunctionBaseConfig, name="add_client_note"):
-    pass
-
-
-@register_function(config_type=AddClientNoteConfig)
-async def add_client_note_function(config: AddClientNoteConfig, builder: Builder):
-    """Add a note to a client's profile."""
-    yield FunctionInfo.from_fn(
-        add_client_note,
-        description=(
-            "Add a note or interaction record to a client's profile. "
-            "Essential for maintaining relationship history and project progress tracking. "
-            "Example: 'Add note to client 1: Had productive call about AI implementation'"
-        )
-    )
-
-
-class GetClientDetailsConfig(FunctionBaseConfig, name="get_client_details"):
-    pass
-
-
-@register_function(config_type=GetClientDetailsConfig)
-async def get_client_details_function(config: GetClientDetailsConfig, builder: Builder):
-    """Get detailed information about a specific client."""
-    yield FunctionInfo.from_fn(
-        get_client_details,
-        description=(
-            "Get detailed information about a specific client including contact info, "
-            "project requirements, and interaction history. "
-            "Example: 'Show me details for client 1' or 'Get client information for John Smith'"
-        )
-    )
-
-
-class FindClientByNameConfig(FunctionBaseConfig, name="find_client_by_name"):
-    pass
-
-
-@register_function(config_type=FindClientByNameConfig)
-async def find_client_by_name_function(config: FindClientByNameConfig, builder: Builder):
-    """Find a client by name."""
-    yield FunctionInfo.from_fn(
-        find_client_by_name,
-        description=(
-            "Find a client by searching their name (partial matches allowed). "
-            "Returns client details including their ID, which can be used for other operations. "
-            "Example: 'Find client Sarah Johnson' or 'Look up Sarah'"
-        )
-    )
+def _load_tool(name: str) -> Callable[..., Any]:
+    """Import the module defining tool *name* (once) and return the callable."""
+    module_path = _TOOL_MODULES[name]
+    module = _loaded_modules.get(module_path)
+    if module is None:
+        module = importlib.import_module(module_path, __package__)
+        _loaded_modules[module_path] = module
+    return getattr(module, name)
+
+
+def __getattr__(name: str) -> Any:
+    # Keep ``register.add_task`` and friends importable now that the tool
+    # modules are no longer imported eagerly.
+    if name in _TOOL_MODULES:
+        return _load_tool(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@dataclass(frozen=True, slots=True)
+class _ToolSpec:
+    """One NAT function: registered name, tool callable name, LLM description."""
+    name: str
+    tool: str
+    description: str
+
+
+# The config class (``AddTaskConfig`` for "add_task") and registration
+# generator (``add_task_function``) are generated from this table below.
+_TOOL_SPECS: Tuple[_ToolSpec, ...] = (
+    # Weather Tools - Commented out (uncomment and add OPENWEATHER_API_KEY to use)
+    # _ToolSpec("weather_info", "get_weather_info", (
+    #     "Get current weather information for any city. "
+    #     "Provide the city name and get temperature, conditions, and humidity. "
+    #     "Example: 'What's the weather in New York?'"
+    # )),
+    # _ToolSpec("weather_condition", "check_weather_condition", (
+    #     "Check if a specific weather condition exists in a city. "
+    #     "Useful for questions like 'Is it raining in London?' or 'Is it sunny in Miami?'"
+    # )),
+    # Task Management Tools
+    _ToolSpec("add_task", "add_task", (
+        "Add a new task to your personal task list. This tool is ALWAYS available for task creation. "
+        "Can be used independently or as part of multi-step workflows. "
+        "Example: 'Add a task to follow up with Sarah Johnson next week'"
+    )),
+    _ToolSpec("list_tasks", "list_tasks", (
+        "List tasks with flexible filtering. Extract filter parameters from natural language:\n"
+        "- 'show all tasks' → list_tasks() [default: shows all]\n"
+        "- 'show completed tasks' → list_tasks(status='completed')\n"
+        "- 'show pending tasks' → list_tasks(status='pending')\n"
+        "- 'tasks for Sarah Johnson' → list_tasks(client_name='Sarah Johnson')\n"
+        "- 'completed tasks for Alex' → list_tasks(status='completed', client_name='Alex Chen')\n"
+        "- 'find urgent tasks' → list_tasks(query='urgent')\n"
+        "The LLM should intelligently map user requests to appropriate parameters. "
+        "Status options: 'completed', 'pending', or '' for all."
+    )),
+    _ToolSpec("complete_task", "complete_task", (
+        "Mark a task as completed. You can specify the task by its ID number or by part of its description. "
+        "Example: 'Complete task 1' or 'Mark the grocery task as done'"
+    )),
+    _ToolSpec("delete_task", "delete_task", (
+        "Delete a task from your task list. You can specify the task by its ID number or by part of its description. "
+        "Example: 'Delete task 1' or 'Remove the grocery task'"
+    )),
+    _ToolSpec("list_tasks_for_client", "list_tasks_for_client", (
+        "List all tasks associated with a specific client. Shows both pending and completed tasks for that client. "
+        "Example: 'List tasks for Alex Chen' or 'Show all tasks for Microsoft'"
+    )),
+    _ToolSpec("add_client_task", "add_client_task", (
+        "Add a task associated with a specific client. Automatically links the task to the client for better organization. "
+        "Example: 'Add task for Microsoft: Review GPU cluster requirements' or 'Create task for Alex Chen to follow up on project'"
+    )),
+    _ToolSpec("assign_random_clients", "assign_random_clients_to_unassigned_tasks", (
+        "Assign random clients to all tasks that do not have a specific client name associated with them. "
+        "This helps ensure better task organization and client relationship management. "
+        "Use this when you notice tasks without client assignments or when asked to organize tasks by clients."
+    )),
+    # Calculator Tools
+    _ToolSpec("add_numbers", "add_numbers", (
+        "Add two or more numbers together. "
+        "Example: 'Add 25 and 37' or 'What's 10 + 20 + 30?'"
+    )),
+    _ToolSpec("subtract_numbers", "subtract_numbers", (
+        "Subtract the second number from the first number. "
+        "Example: 'Subtract 15 from 50' or 'What's 100 - 25?'"
+    )),
+    _ToolSpec("multiply_numbers", "multiply_numbers", (
+        "Multiply two or more numbers together. "
+        "Example: 'Multiply 8 by 7' or 'What's 5 × 4 × 3?'"
+    )),
+    _ToolSpec("divide_numbers", "divide_numbers", (
+        "Divide the first number by the second number. "
+        "Example: 'Divide 100 by 4' or 'What's 50 ÷ 2?'"
+    )),
+    # Percentage calculator function - required for demo step 4
+    _ToolSpec("calculate_percentage", "calculate_percentage", (
+        "Calculate a percentage of a number for financial and business calculations. "
+        "Always available for percentage calculations like '15% of 50000' or 'What's 20 percent of 150?'. "
+        "Essential for budget calculations and business intelligence."
+    )),
+    # Date/Time Tools
+    _ToolSpec("current_time", "get_current_time", (
+        "Get the current time in 12-hour format with AM/PM. "
+        "Example: 'What time is it?' or 'Tell me the current time'"
+    )),
+    _ToolSpec("current_date", "get_current_date", (
+        "Get the current date with day of week, month, day, and year. "
+        "Example: 'What's today's date?' or 'What day is it?'"
+    )),
+    # Additional datetime functions - uncomment if needed
+    # _ToolSpec("timezone_info", "get_timezone_info", (
+    #     "Get information about the current timezone including name and UTC offset. "
+    #     "Example: 'What timezone am I in?' or 'What's my timezone?'"
+    # )),
+    # _ToolSpec("time_difference", "calculate_time_difference", (
+    #     "Calculate what time it will be after adding or subtracting hours from now. "
+    #     "Example: 'What time will it be in 3 hours?' or 'What time was it 2 hours ago?'"
+    # )),
+    # _ToolSpec("day_of_week", "get_day_of_week", (
+    #     "Get the current day of the week. "
+    #     "Example: 'What day is today?' or 'What day of the week is it?'"
+    # )),
+    # _ToolSpec("current_hour", "get_current_hour", (
+    #     "Get the current hour in 24-hour format (0-23). "
+    #     "Useful for time-based comparisons and calculations."
+    # )),
+    # Enterprise Tools for Solutions Architect Showcase
+    # Meeting Scheduler Tools
+    _ToolSpec("schedule_meeting", "schedule_meeting", (
+        "Schedule a meeting with specified participants and timing details. "
+        "This tool is ALWAYS available for scheduling meetings. "
+        "Accepts natural language times like 'tomorrow at 3 PM' and participant names. "
+        "Example: 'Schedule a meeting with Sarah Johnson tomorrow at 3 PM for 90 minutes'"
+    )),
+    _ToolSpec("list_meetings", "list_meetings", (
+        "List all scheduled meetings. This tool is ALWAYS available for retrieving meeting information. "
+        "Can be used independently or as part of multi-step workflows. "
+        "Example: 'List all meetings' or 'Show me my meetings'"
+    )),
+    _ToolSpec("cancel_meeting", "cancel_meeting", (
+        "Cancel a scheduled meeting by ID with optional reason. "
+        "Includes automatic notification simulation for participants. "
+        "Example: 'Cancel meeting 1' or 'Cancel the 2 PM meeting'"
+    )),
+    # Client Management Tools
+    _ToolSpec("add_client", "add_client", (
+        "Add a new client with contact information, company details, and project requirements. "
+        "Essential for solutions architect client relationship management. "
+        "Example: 'Add client John Smith from TechCorp with email john@techcorp.com'"
+    )),
+    _ToolSpec("list_clients", "list_clients", (
+        "List all clients in the CRM system. By default shows ALL clients unless specifically asked to filter. "
+        "IMPORTANT: Only use filters parameter if the user specifically asks for filtering by priority. "
+        "FILTERS: Use 'high', 'medium', 'low', or 'active' only when explicitly requested. "
+        "Examples: "
+        "- 'List all clients' → list_clients('') or list_clients() - shows ALL clients "
+        "- 'Show high priority clients only' → list_clients('high') "
+        "- 'Show medium priority clients' → list_clients('medium') "
+        "- 'Show active clients only' → list_clients('active') "
+        "PAGINATION: Returns every matching client unless 'limit' is given; with a limit, "
+        "if 'total' is larger than 'count', call again with a higher offset."
+    )),
+    _ToolSpec("add_client_note", "add_client_note", (
+        "Add a note or interaction record to a client's profile. "
+        "Essential for maintaining relationship history and project progress tracking. "
+        "Example: 'Add note to client 1: Had productive call about AI implementation'"
+    )),
+    _ToolSpec("get_client_details", "get_client_details", (
+        "Get detailed information about a specific client including contact info, "
+        "project requirements, and interaction history. "
+        "Example: 'Show me details for client 1' or 'Get client information for John Smith'"
+    )),
+    _ToolSpec("find_client_by_name", "find_client_by_name", (
+        "Find a client by searching their name (partial matches allowed). "
+        "Returns client details including their ID, which can be used for other operations. "
+        "Example: 'Find client Sarah Johnson' or 'Look up Sarah'"
+    )),
+    _ToolSpec("update_client_email", "update_client_email", (
+        "Update a client's email address by specifying the client ID or name. "
+        "Use to correct or add missing emails. "
+        "Example: 'Update Netflix email to ops@netflix.com' or 'Set email for client 3 to ops@netflix.com'"
+    )),
+)
 
 
-class UpdateClientEmailConfig(FunctionBaseConfig, name="update_client_email"):
-    pass
+def _config_class_name(name: str) -> str:
+    return "".join(part.title() for part in name.split("_")) + "Config"
 
 
-@register_function(config_type=UpdateClientEmailConfig)
-async def update_client_email_function(config: UpdateClientEmailConfig, builder: Builder):
-    """Update a client's email by ID or name."""
-    yield FunctionInfo.from_fn(
-        update_client_email,
-        description=(
-            "Update a client's email address by specifying the client ID or name. "
-            "Use to correct or add missing emails. "
-            "Example: 'Update Netflix email to ops@netflix.com' or 'Set email for client 3 to ops@netflix.com'"
-        )
+def _make_config(name: str) -> Type[FunctionBaseConfig]:
+    """Create the ``FunctionBaseConfig`` subclass NAT resolves ``_type: name`` to."""
+    return types.new_class(
+        _config_class_name(name),
+        (FunctionBaseConfig,),
+        {"name": name},
+        lambda namespace: namespace.update(__module__=__name__),
     )
 
 
+@functools.lru_cache(maxsize=None)
+def _tool_info(spec: _ToolSpec) -> FunctionInfo:
+    """Build the ``FunctionInfo`` for a tool once; later workflow builds reuse it."""
+    return FunctionInfo.from_fn(_load_tool(spec.tool), description=spec.description)
 
 
+async def _register_tool(spec: _ToolSpec, config: FunctionBaseConfig, builder: Builder):
+    """Registration generator shared by every ``_TOOL_SPECS`` entry via ``partial``."""
+    yield _tool_info(spec)
 
 
+for _spec in _TOOL_SPECS:
+    _config_type = _make_config(_spec.name)
+    # partial objects carry no __name__; set one for NAT's registry and logs
+    _function = functools.partial(_register_tool, _spec)
+    _function.__name__ = _function.__qualname__ = f"{_spec.name}_function"
+    globals()[_config_type.__name__] = _config_type
+    globals()[_function.__name__] = register_function(config_type=_config_type)(_function)
 
-
-
+del _spec, _config_type, _function
@@ -15,15 +15,29 @@
 
 """Calculator tools for the Personal Assistant Demo."""
 
-import json
+import math
 import re
 import logging
 import time
 import functools
-from typing import List, Any, Callable
+from typing import List, Any, Callable, Tuple, Union
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# Integers and decimals, optionally negative
+_NUM_RE = re.compile(r'-?\d+(?:\.\d+)?')
+# "20% of 150" or "20 percent of 150"
+_PCT_RE = re.compile(r'(\d+\.?\d*)%?\s*(?:percent)?\s*of\s*(\d+\.?\d*)', re.IGNORECASE)
+_MIN_CACHED_TEXT_LENGTH = 8
+# Longer whole numbers are parsed as floats, as before, so results stay
+# within the 64-bit integers orjson can encode
+_MAX_INT_LENGTH = 15
+_INT64_BITS = 63
+
+Number = Union[int, float]
+
 
 class CalculatorError(Exception):
     """Custom exception for calculator-related errors."""
@@ -33,8 +47,8 @@ class CalculatorError(Exception):
         super().__init__(message)
 
 
-def _validate_calculation_input(text: str, min_numbers: int = 2) -> None:
-    """Validate calculator input parameters."""
+def _validate_and_extract(text: str, min_numbers: int = 2) -> List[Number]:
+    """Validate calculator input parameters and return the numbers found in it."""
     if not text or not text.strip():
         raise CalculatorError("Input text cannot be empty", "INVALID_INPUT")
     
@@ -44,59 +58,92 @@ def _validate_calculation_input(text: str, min_numbers: int = 2) -> None:
     numbers = _extract_numbers(text)
     if len(numbers) < min_numbers:
         raise CalculatorError(f"Please provide at least {min_numbers} number{'s' if min_numbers > 1 else ''}", "INSUFFICIENT_NUMBERS")
+    
+    return numbers
 
 
 def _create_standard_response(success: bool, data: Any = None, message: str = "", 
                              error: str = None, error_code: str = None) -> str:
     """Create standardized JSON response."""
+    if not success:
+        return _error_response(message, error or "Unknown error", error_code)
+    
     response = {
         "success": success,
         "message": message
     }
     
-    if success:
-        if data is not None:
-            response["data"] = data
-    else:
-        response["error"] = error or "Unknown error"
-        if error_code:
-            response["error_code"] = error_code
+    if data is not None:
+        response["data"] = data
+    
+    return orjson.dumps(response).decode()
+
+
+@functools.lru_cache(maxsize=128)
+def _error_response(message: str, error: str, error_code: str = None) -> str:
+    """Serialize an error response; the set of calculator errors is small and fixed."""
+    response = {
+        "success": False,
+        "message": message,
+        "error": error
+    }
+    
+    if error_code:
+        response["error_code"] = error_code
     
-    return json.dumps(response)
+    return orjson.dumps(response).decode()
 
 
 def measure_performance(func: Callable) -> Callable:
     """Decorator to measure and log function performance."""
+    function_name = func.__name__
+    
     @functools.wraps(func)
     async def wrapper(*args, **kwargs):
-        start_time = time.time()
-        function_name = func.__name__
+        # Timing only feeds the log lines below; skip it when none can be emitted
+        if not logger.isEnabledFor(logging.ERROR):
+            return await func(*args, **kwargs)
+        
+        start_time = time.perf_counter()
         
         try:
             result = await func(*args, **kwargs)
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             
             if execution_time > 0.5:  # Log slow operations (lower threshold for calculations)
-                logger.warning(f"{function_name} took {execution_time:.3f}s (slow)")
+                logger.warning("%s took %.3fs (slow)", function_name, execution_time)
             else:
-                logger.info(f"{function_name} completed in {execution_time:.3f}s")
+                logger.info("%s completed in %.3fs", function_name, execution_time)
             
             return result
             
         except Exception as e:
-            execution_time = time.time() - start_time
-            logger.error(f"{function_name} failed after {execution_time:.3f}s: {e}")
+            execution_time = time.perf_counter() - start_time
+            logger.error("%s failed after %.3fs: %s", function_name, execution_time, e)
             raise
     
     return wrapper
 
 
-def _extract_numbers(text: str) -> List[float]:
+def _parse_number(match: str) -> Number:
+    # Whole numbers stay ints so "3 + 5" reports 8 rather than 8.0
+    if '.' in match or len(match) > _MAX_INT_LENGTH:
+        return float(match)
+    return int(match)
+
+
+@functools.lru_cache(maxsize=1024)
+def _extract_numbers_cached(text: str) -> Tuple[Number, ...]:
+    return tuple(map(_parse_number, _NUM_RE.findall(text)))
+
+
+def _extract_numbers(text: str) -> List[Number]:
     """Extract numbers from text, supporting both integers and floats."""
-    # Pattern to match integers and floats (including negative numbers)
-    pattern = r'-?\d+\.?\d*'
-    matches = re.findall(pattern, text)
-    return [float(match) for match in matches if match]
+    # Retries and replays resend the same prompt; very short inputs aren't
+    # worth a cache slot.
+    if len(text) < _MIN_CACHED_TEXT_LENGTH:
+        return list(map(_parse_number, _NUM_RE.findall(text)))
+    return list(_extract_numbers_cached(text))
 
 
 @measure_performance
@@ -112,16 +159,14 @@ async def add_numbers(text: str) -> str:
     """
     try:
         # Input validation
-        _validate_calculation_input(text, min_numbers=2)
-        
-        numbers = _extract_numbers(text)
+        numbers = _validate_and_extract(text, min_numbers=2)
         result = sum(numbers)
         
         # Create human-readable message
         if len(numbers) == 2:
             operation_str = f"{numbers[0]} + {numbers[1]}"
         else:
-            operation_str = " + ".join(str(n) for n in numbers)
+            operation_str = " + ".join(map(str, numbers))
         
         message = f"The sum of {operation_str} = {result}"
         
@@ -167,9 +212,7 @@ async def subtract_numbers(text: str) -> str:
     """
     try:
         # Input validation
-        _validate_calculation_input(text, min_numbers=2)
-        
-        numbers = _extract_numbers(text)
+        numbers = _validate_and_extract(text, min_numbers=2)
         
         # Check for too many numbers (keeping original behavior)
         if len(numbers) > 2:
@@ -221,19 +264,18 @@ async def multiply_numbers(text: str) -> str:
     """
     try:
         # Input validation
-        _validate_calculation_input(text, min_numbers=2)
+        numbers = _validate_and_extract(text, min_numbers=2)
         
-        numbers = _extract_numbers(text)
-        
-        result = 1
-        for num in numbers:
-            result *= num
+        result = math.prod(numbers)
+        if isinstance(result, int) and result.bit_length() > _INT64_BITS:
+            # Too large to encode as a JSON integer; fall back to float math
+            result = math.prod(map(float, numbers))
         
         # Create human-readable message
         if len(numbers) == 2:
             operation_str = f"{numbers[0]} × {numbers[1]}"
         else:
-            operation_str = " × ".join(str(n) for n in numbers)
+            operation_str = " × ".join(map(str, numbers))
         
         message = f"The product of {operation_str} = {result}"
         
@@ -279,9 +321,7 @@ async def divide_numbers(text: str) -> str:
     """
     try:
         # Input validation
-        _validate_calculation_input(text, min_numbers=2)
-        
-        numbers = _extract_numbers(text)
+        numbers = _validate_and_extract(text, min_numbers=2)
         
         # Check for too many numbers (keeping original behavior)
         if len(numbers) > 2:
@@ -336,66 +376,52 @@ async def calculate_percentage(text: str) -> str:
         JSON string with standardized response format
     """
     try:
-        # Input validation
-        if not text or not text.strip():
+        # Input validation (only over-long text needs stripping to check the
+        # limit; blank text can't match and is rejected before the fallback)
+        if not text:
             raise CalculatorError("Input text cannot be empty", "INVALID_INPUT")
         
-        if len(text.strip()) > 1000:
+        if len(text) > 1000 and len(text.strip()) > 1000:
             raise CalculatorError("Input text too long (max 1000 characters)", "INPUT_TOO_LONG")
         
         # Look for percentage pattern like "20% of 150" or "20 percent of 150"
-        percentage_pattern = r'(\d+\.?\d*)%?\s*(?:percent)?\s*of\s*(\d+\.?\d*)'
-        match = re.search(percentage_pattern, text, re.IGNORECASE)
+        match = _PCT_RE.search(text)
         
         if match:
-            percentage = float(match.group(1))
-            number = float(match.group(2))
-            result = (percentage / 100) * number
-            
-            operation_str = f"{percentage}% of {number}"
-            message = f"{operation_str} = {result}"
-            
-            # Create response data
-            response_data = {
-                "operation": "percentage",
-                "percentage": percentage,
-                "base_number": number,
-                "result": result,
-                "expression": operation_str
-            }
+            percentage = _parse_number(match.group(1))
+            number = _parse_number(match.group(2))
+        else:
+            if not text.strip():
+                raise CalculatorError("Input text cannot be empty", "INVALID_INPUT")
             
-            return _create_standard_response(
-                success=True,
-                data=response_data,
-                message=message
-            )
-        
-        # Fallback: try to extract two numbers and assume first is percentage
-        numbers = _extract_numbers(text)
-        if len(numbers) >= 2:
+            # Fallback: try to extract two numbers and assume first is percentage
+            numbers = _extract_numbers(text)
+            if len(numbers) < 2:
+                raise CalculatorError("Please provide a percentage and a number (e.g., '20% of 150' or '20 percent of 150')", "INVALID_PERCENTAGE_FORMAT")
             percentage = numbers[0]
             number = numbers[1]
-            result = (percentage / 100) * number
-            
-            operation_str = f"{percentage}% of {number}"
-            message = f"{operation_str} = {result}"
-            
-            # Create response data
-            response_data = {
-                "operation": "percentage",
-                "percentage": percentage,
-                "base_number": number,
-                "result": result,
-                "expression": operation_str
-            }
-            
-            return _create_standard_response(
-                success=True,
-                data=response_data,
-                message=message
-            )
         
-        raise CalculatorError("Please provide a percentage and a number (e.g., '20% of 150' or '20 percent of 150')", "INVALID_PERCENTAGE_FORMAT")
+        # Both paths parse through _parse_number, so "20% of 150" formats the
+        # same however it was phrased
+        result = (percentage / 100) * number
+        
+        operation_str = f"{percentage}% of {number}"
+        message = f"{operation_str} = {result}"
+        
+        # Create response data
+        response_data = {
+            "operation": "percentage",
+            "percentage": percentage,
+            "base_number": number,
+            "result": result,
+            "expression": operation_str
+        }
+        
+        return _create_standard_response(
+            success=True,
+            data=response_data,
+            message=message
+        )
         
     except CalculatorError as e:
         return _create_standard_response(
@@ -6,17 +6,19 @@ need for managing client relationships, tracking projects, and maintaining profe
 communication records.
 """
 
-import json
+import asyncio
 import os
 import logging
 import tempfile
-import shutil
 import uuid
 import time
+import weakref
 import functools
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Callable
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Callable, Tuple
 from pathlib import Path
+import orjson
 from filelock import FileLock
 from ._paths import data_path
 
@@ -26,6 +28,18 @@ _CLIENTS_LOCK = FileLock(str(CLIENTS_FILE) + ".lock", timeout=5)
 
 logger = logging.getLogger(__name__)
 
+_VALID_PRIORITIES = ("high", "medium", "low")
+_PRIORITY_ORDER = {"high": 1, "medium": 2, "low": 3}
+# list_clients filter phrases ("high", "high-priority", "highpriority", ...)
+# mapped to the priority they select
+_PRIORITY_FILTERS = {
+    f"{priority}{suffix}": priority
+    for priority in _VALID_PRIORITIES
+    for suffix in ("", "-priority", "priority")
+}
+# Rendered list_clients responses kept per snapshot
+_LISTING_CACHE_SIZE = 32
+
 
 class ClientError(Exception):
     """Custom exception for client-related errors."""
@@ -52,9 +66,8 @@ def _validate_client_input(name: str, company: str, email: str = "", priority: s
     if email and len(email) > 200:
         raise ClientError("Email too long (max 200 characters)", "EMAIL_TOO_LONG")
     
-    valid_priorities = ["high", "medium", "low"]
-    if priority and priority.lower() not in valid_priorities:
-        raise ClientError(f"Priority must be one of: {', '.join(valid_priorities)}", "INVALID_PRIORITY")
+    if priority and priority.lower() not in _VALID_PRIORITIES:
+        raise ClientError(f"Priority must be one of: {', '.join(_VALID_PRIORITIES)}", "INVALID_PRIORITY")
 
 
 def _generate_client_id() -> str:
@@ -62,6 +75,11 @@ def _generate_client_id() -> str:
     return str(uuid.uuid4())[:8]  # Use first 8 chars for readability
 
 
+def _dumps(obj: Any) -> str:
+    """Serialize a tool response to a JSON string."""
+    return orjson.dumps(obj).decode()
+
+
 def _create_standard_response(success: bool, data: Any = None, message: str = "", 
                              error: str = None, error_code: str = None) -> str:
     """Create standardized JSON response."""
@@ -78,15 +96,10 @@ def _create_standard_response(success: bool, data: Any = None, message: str = ""
         if error_code:
             response["error_code"] = error_code
     
-    return json.dumps(response)
-
-
-# Performance monitoring and caching
-_client_cache = {}
-_cache_timestamps = {}
-CACHE_TTL = 30  # seconds
+    return _dumps(response)
 
 
+# Performance monitoring
 def measure_performance(func: Callable) -> Callable:
     """Decorator to measure and log function performance."""
     @functools.wraps(func)
@@ -113,91 +126,137 @@ def measure_performance(func: Callable) -> Callable:
     return wrapper
 
 
-def _get_cache_key(func_name: str, args: tuple, kwargs: dict) -> str:
-    """Generate cache key from function name and arguments."""
-    args_str = str(args) + str(sorted(kwargs.items()))
-    return f"{func_name}:{hash(args_str)}"
-
-
-def _is_cache_valid(cache_key: str) -> bool:
-    """Check if cached data is still valid."""
-    if cache_key not in _cache_timestamps:
-        return False
-    timestamp = _cache_timestamps[cache_key]
-    return (time.time() - timestamp) < CACHE_TTL
+class _ClientIndex:
+    """Lookup tables over one clients snapshot, rebuilt whenever it changes."""
+    
+    def __init__(self, clients: List[Dict[str, Any]]):
+        self.clients = clients
+        self.by_id: Dict[Any, Dict[str, Any]] = {}
+        self.email_positions: Dict[str, int] = {}
+        self.name_company_positions: Dict[Tuple[str, str], int] = {}
+        self.id_strings = {str(client.get("id")) for client in clients}
+        # Lowercased once per snapshot instead of on every name search
+        self.names_lower = [(str(client.get("name", "")).lower(), client) for client in clients]
+        # list_clients responses keyed by (filters, limit, offset); dropped with the snapshot
+        self.listings: "OrderedDict[Tuple[str, Optional[int], int], str]" = OrderedDict()
+        
+        # First occurrence wins, matching the linear scans these replace
+        for position, client in enumerate(clients):
+            self.by_id.setdefault(client.get("id"), client)
+            name_company = (self.names_lower[position][0], str(client.get("company", "")).lower())
+            self.name_company_positions.setdefault(name_company, position)
+            email = client.get("email")
+            if email:
+                self.email_positions.setdefault(email, position)
+    
+    @functools.cached_property
+    def by_priority(self) -> List[Dict[str, Any]]:
+        """Clients by priority (high first) then name; sorted on first use."""
+        return sorted(self.clients, key=lambda x: (_PRIORITY_ORDER.get(x.get("priority", "medium"), 2), x["name"]))
+    
+    def match_name(self, fragment_lower: str) -> List[Dict[str, Any]]:
+        """Clients whose name contains *fragment_lower* (case-insensitive), in file order."""
+        return [client for name_lower, client in self.names_lower if fragment_lower in name_lower]
 
 
-def _get_from_cache(cache_key: str) -> Optional[str]:
-    """Get data from cache if valid."""
-    if _is_cache_valid(cache_key) and cache_key in _client_cache:
-        logger.info(f"Cache hit for {cache_key[:20]}...")
-        return _client_cache[cache_key]
-    return None
+# Parsed clients file, reused until the file's (mtime_ns, size) changes
+_clients_snapshot: List[Dict[str, Any]] = []
+_clients_snapshot_key: Optional[Tuple[int, int]] = None
+_clients_index = _ClientIndex([])
 
 
-def _set_cache(cache_key: str, data: str) -> None:
-    """Set data in cache with timestamp."""
-    _client_cache[cache_key] = data
-    _cache_timestamps[cache_key] = time.time()
-    
-    if len(_client_cache) > 50:
-        oldest_key = min(_cache_timestamps.keys(), key=lambda k: _cache_timestamps[k])
-        del _client_cache[oldest_key]
-        del _cache_timestamps[oldest_key]
+def _file_key(path: Path) -> Tuple[int, int]:
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
 
 
-def _invalidate_client_cache() -> None:
-    """Clear client-related cache when data changes."""
-    keys_to_remove = [k for k in _client_cache.keys() if k.startswith('list_clients')]
-    for key in keys_to_remove:
-        _client_cache.pop(key, None)
-        _cache_timestamps.pop(key, None)
-    logger.info(f"Invalidated {len(keys_to_remove)} client cache entries")
+def _set_snapshot(clients: List[Dict[str, Any]], file_key: Tuple[int, int]) -> None:
+    global _clients_snapshot, _clients_snapshot_key, _clients_index
+    _clients_snapshot = clients
+    _clients_snapshot_key = file_key
+    _clients_index = _ClientIndex(clients)
 
 
-def _load_clients() -> List[Dict[str, Any]]:
-    """Load clients from the JSON file with proper error handling."""
+def _load_indexed_clients() -> Tuple[List[Dict[str, Any]], _ClientIndex]:
+    """Load clients and their lookup index with proper error handling."""
+    global _clients_snapshot_key
     try:
         with _CLIENTS_LOCK:
-            if CLIENTS_FILE.exists():
-                return json.loads(CLIENTS_FILE.read_text(encoding="utf-8"))
-            return []
+            if not CLIENTS_FILE.exists():
+                _clients_snapshot_key = None
+                return [], _ClientIndex([])
+            
+            file_key = _file_key(CLIENTS_FILE)
+            if file_key != _clients_snapshot_key:
+                _set_snapshot(orjson.loads(CLIENTS_FILE.read_bytes()), file_key)
+            
+            # Callers append to and sort what they get back
+            return list(_clients_snapshot), _clients_index
     except Exception as e:
         logger.error(f"Error loading clients: {e}")
-        return []
+        return [], _ClientIndex([])
+
+
+def _load_clients() -> List[Dict[str, Any]]:
+    """Load clients from the JSON file with proper error handling."""
+    return _load_indexed_clients()[0]
 
 
 def _save_clients(data: List[Dict[str, Any]]) -> None:
     """Save clients to the JSON file atomically."""
+    global _clients_snapshot_key
     try:
         CLIENTS_FILE.parent.mkdir(parents=True, exist_ok=True)
         
         with _CLIENTS_LOCK:
             # Write to temp file first for atomic operation
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.tmp', 
-                                           dir=CLIENTS_FILE.parent, delete=False,
-                                           encoding='utf-8') as tmp_file:
-                json.dump(data, tmp_file, indent=2)
+            with tempfile.NamedTemporaryFile(mode='wb', suffix='.tmp', 
+                                           dir=CLIENTS_FILE.parent, delete=False) as tmp_file:
+                tmp_file_path = tmp_file.name
+                tmp_file.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
                 tmp_file.flush()
                 os.fsync(tmp_file.fileno())
-                tmp_file_path = tmp_file.name
             
-            # Atomic move
-            shutil.move(tmp_file_path, CLIENTS_FILE)
+            # Atomic replace (same directory, so never a copy)
+            os.replace(tmp_file_path, CLIENTS_FILE)
+            
+            _set_snapshot(list(data), _file_key(CLIENTS_FILE))
             
     except Exception as e:
+        # Callers may already have mutated snapshot records in place
+        _clients_snapshot_key = None
         logger.error(f"Error saving clients: {e}")
         if 'tmp_file_path' in locals() and os.path.exists(tmp_file_path):
             try:
                 os.remove(tmp_file_path)
-            except:
+            except OSError:
                 pass
         raise ClientError(f"Failed to save clients: {str(e)}", "SAVE_FAILED")
 
 
 
+# File I/O runs in worker threads, so tools that load, modify and save the
+# clients list must not interleave or one update would overwrite another.
+# asyncio locks belong to one event loop, hence one lock per running loop.
+_write_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = weakref.WeakKeyDictionary()
+
+
+def _serialize_writes(func: Callable) -> Callable:
+    """Run a read-modify-write client tool while holding the write lock."""
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        loop = asyncio.get_running_loop()
+        lock = _write_locks.get(loop)
+        if lock is None:
+            lock = _write_locks[loop] = asyncio.Lock()
+        async with lock:
+            return await func(*args, **kwargs)
+    
+    return wrapper
+
 
 @measure_performance
+@_serialize_writes
 async def add_client(
     name: str,
     company: str,
@@ -217,25 +276,25 @@ async def add_client(
         _validate_client_input(name, company, email, priority)
         
         # Load existing clients
-        clients = _load_clients()
+        clients, index = await asyncio.to_thread(_load_indexed_clients)
         
-        # Check for duplicates
-        for client in clients:
-            if email and client.get("email") == email:
-                raise ClientError(f"Client with email {email} already exists", "DUPLICATE_EMAIL")
-            if (client.get("name", "").lower() == name.lower() and 
-                client.get("company", "").lower() == company.lower()):
-                raise ClientError(f"Client '{name}' from company '{company}' already exists", "DUPLICATE_CLIENT")
+        # Check for duplicates, reporting whichever existing client comes first
+        email_position = index.email_positions.get(email, len(clients)) if email else len(clients)
+        name_position = index.name_company_positions.get((name.lower(), company.lower()), len(clients))
+        if name_position < email_position:
+            raise ClientError(f"Client '{name}' from company '{company}' already exists", "DUPLICATE_CLIENT")
+        if email_position < len(clients):
+            raise ClientError(f"Client with email {email} already exists", "DUPLICATE_EMAIL")
         
         # Generate unique client ID
         client_id = _generate_client_id()
         
         # Ensure ID is unique
-        existing_ids = {str(client.get("id")) for client in clients}
-        while client_id in existing_ids:
+        while client_id in index.id_strings:
             client_id = _generate_client_id()
         
-        # Create client object
+        # Create client object; one timestamp keeps created_at and last_contact identical
+        now_iso = datetime.now().isoformat()
         client = {
             "id": client_id,
             "name": name.strip(),
@@ -245,16 +304,13 @@ async def add_client(
             "project_requirements": project_requirements.strip() if project_requirements else "",
             "priority": priority.lower(),
             "status": "active",
-            "created_at": datetime.now().isoformat(),
-            "last_contact": datetime.now().isoformat(),
+            "created_at": now_iso,
+            "last_contact": now_iso,
             "notes": []
         }
         
         clients.append(client)
-        _save_clients(clients)
-        
-        # Invalidate cache
-        _invalidate_client_cache()
+        await asyncio.to_thread(_save_clients, clients)
         
         # Create response data
         response_data = {
@@ -288,66 +344,68 @@ async def add_client(
 
 
 @measure_performance
-async def list_clients(filters: str = "") -> str:
+async def list_clients(filters: str = "", limit: Optional[int] = None, offset: int = 0) -> str:
     """
     List all clients with optional filtering.
     Supports filtering by priority: 'high', 'medium', 'low', or 'high-priority'
+    Returns every client from `offset` on, or at most `limit` of them when given;
+    `total` gives the full match count.
     """
     try:
-        # Check cache first
-        cache_key = _get_cache_key("list_clients", (filters,), {})
-        cached_result = _get_from_cache(cache_key)
-        if cached_result:
+        if limit is not None:
+            limit = max(1, limit)
+        offset = max(0, offset)
+
+        clients, index = await asyncio.to_thread(_load_indexed_clients)
+
+        # Check the current snapshot's cache first
+        cache_key = (filters, limit, offset)
+        cached_result = index.listings.get(cache_key)
+        if cached_result is not None:
+            index.listings.move_to_end(cache_key)
             return cached_result
-        
-        clients = _load_clients()
 
         if not clients:
             result = _create_standard_response(
                 success=True,
-                data={"clients": [], "count": 0, "filter": filters.strip() if filters else None},
+                data={
+                    "clients": [],
+                    "count": 0,
+                    "total": 0,
+                    "offset": offset,
+                    "limit": limit,
+                    "filter": filters.strip() if filters else None
+                },
                 message="No clients found."
             )
-            _set_cache(cache_key, result)
             return result
 
-        # Apply filtering based on the filters parameter
-        filtered_clients = clients
+        # Apply filtering based on the filters parameter; filtering the
+        # snapshot's presorted list keeps the priority-then-name order
+        filtered_clients = index.by_priority
         filter_message = ""
         
         # DEBUG: Log the actual filter parameter being passed
-        import logging
-        logger = logging.getLogger(__name__)
         logger.info(f"list_clients called with filters: '{filters}' (type: {type(filters)})")
 
         if filters and filters.strip():
             filters_lower = filters.lower().strip()
             logger.info(f"Normalized filters: '{filters_lower}'")
             
-            # Define valid priority values
-            valid_priorities = ["high", "medium", "low"]
-
             # FIXED: Much more restrictive filtering to avoid false positives
-            priority_filter = None
-            
             # Only filter if the filter string exactly matches expected patterns
-            if filters_lower in valid_priorities:
-                priority_filter = filters_lower
-            elif filters_lower in [f"{p}-priority" for p in valid_priorities]:
-                priority_filter = filters_lower.replace("-priority", "")
-            elif filters_lower in [f"{p}priority" for p in valid_priorities]:
-                priority_filter = filters_lower.replace("priority", "")
-            elif filters_lower == "active":
-                # Keep active filtering as-is
-                filtered_clients = [c for c in clients if c.get("status", "active").lower() == "active"]
-                filter_message = " (active only)"
+            priority_filter = _PRIORITY_FILTERS.get(filters_lower)
                 
             if priority_filter:
                 logger.info(f"Applying priority filter: {priority_filter}")
                 # Filter for specific priority clients
-                filtered_clients = [c for c in clients if c.get("priority", "medium").lower() == priority_filter]
+                filtered_clients = [c for c in index.by_priority if c.get("priority", "medium").lower() == priority_filter]
                 filter_message = f" ({priority_filter} priority only)"
-            elif filters_lower not in ["active"] and not priority_filter:
+            elif filters_lower == "active":
+                # Keep active filtering as-is
+                filtered_clients = [c for c in index.by_priority if c.get("status", "active").lower() == "active"]
+                filter_message = " (active only)"
+            else:
                 # If filters provided but don't match any expected pattern, log warning but show all
                 logger.warning(f"Unrecognized filter '{filters_lower}' - showing all clients")
                 filter_message = " (filter not recognized, showing all)"
@@ -356,10 +414,6 @@ async def list_clients(filters: str = "") -> str:
         logger.info(f"Total clients loaded: {len(clients)}")
         logger.info(f"Clients after filtering: {len(filtered_clients)}")
         
-        # Sort by priority (high first) then by name
-        priority_order = {"high": 1, "medium": 2, "low": 3}
-        filtered_clients.sort(key=lambda x: (priority_order.get(x.get("priority", "medium"), 2), x["name"]))
-
         # Project to a compact representation to keep downstream LLM prompts small
         def _project_client(c: Dict[str, Any]) -> Dict[str, Any]:
             email = c.get("email", "").strip()
@@ -378,7 +432,10 @@ async def list_clients(filters: str = "") -> str:
                 "email": email_display
             }
 
-        slim_clients = [_project_client(c) for c in filtered_clients]
+        # Only the requested page is projected and serialized
+        total = len(filtered_clients)
+        end = None if limit is None else offset + limit
+        slim_clients = [_project_client(c) for c in filtered_clients[offset:end]]
         
         # DEBUG: Log final count and client names
         logger.info(f"Final projected clients count: {len(slim_clients)}")
@@ -387,17 +444,29 @@ async def list_clients(filters: str = "") -> str:
         response_data = {
             "clients": slim_clients,
             "count": len(slim_clients),
+            "total": total,
+            "offset": offset,
+            "limit": limit,
             "filter": filters.strip() if filters else None
         }
         
+        message = f"Found {total} client(s){filter_message}."
+        if len(slim_clients) < total:
+            if slim_clients:
+                message += f" Showing {offset + 1}-{offset + len(slim_clients)}; pass offset to see more."
+            else:
+                message += f" No clients at offset {offset}."
+
         result = _create_standard_response(
             success=True,
             data=response_data,
-            message=f"Found {len(slim_clients)} client(s){filter_message}."
+            message=message
         )
         
         # Cache the result
-        _set_cache(cache_key, result)
+        index.listings[cache_key] = result
+        if len(index.listings) > _LISTING_CACHE_SIZE:
+            index.listings.popitem(last=False)
         return result
         
     except Exception as e:
@@ -414,35 +483,30 @@ async def find_client_by_name(name: str) -> Dict[str, Any]:
     Find a client by name and return their details.
     """
     try:
-        clients = _load_clients()
+        clients, index = await asyncio.to_thread(_load_indexed_clients)
         
         if not clients:
-            return json.dumps({
+            return _dumps({
                 "success": False,
                 "error": "No clients found."
             })
         
         # Search for client by name (case-insensitive partial match)
-        matches = []
-        name_lower = name.lower()
-        
-        for client in clients:
-            if name_lower in client["name"].lower():
-                matches.append(client)
+        matches = index.match_name(name.lower())
         
         if len(matches) == 0:
-            return json.dumps({
+            return _dumps({
                 "success": False,
                 "error": f"No client found matching '{name}'."
             })
         elif len(matches) == 1:
-            return json.dumps({
+            return _dumps({
                 "success": True,
                 "client": matches[0],
                 "message": f"Found client: {matches[0]['name']} (ID: {matches[0]['id']})"
             })
         else:
-            return json.dumps({
+            return _dumps({
                 "success": True,
                 "multiple_matches": True,
                 "clients": matches,
@@ -450,12 +514,13 @@ async def find_client_by_name(name: str) -> Dict[str, Any]:
             })
             
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": f"Failed to search for client: {str(e)}"
         })
 
 
+@_serialize_writes
 async def add_client_note(
     client_identifier: str,
     note: str,
@@ -465,10 +530,10 @@ async def add_client_note(
     Add a note to a client's profile. Can use client ID (as string) or client name.
     """
     try:
-        clients = _load_clients()
+        clients, index = await asyncio.to_thread(_load_indexed_clients)
         
         if not clients:
-            return json.dumps({
+            return _dumps({
                 "success": False,
                 "error": "No clients found."
             })
@@ -477,52 +542,45 @@ async def add_client_note(
         target_client = None
         if client_identifier.isdigit():
             # It's a client ID
-            client_id = int(client_identifier)
-            for client in clients:
-                if client["id"] == client_id:
-                    target_client = client
-                    break
+            target_client = index.by_id.get(int(client_identifier))
         else:
             # It's a name, find the client
-            identifier_lower = client_identifier.lower()
-            matches = []
-            for client in clients:
-                if identifier_lower in client["name"].lower():
-                    matches.append(client)
+            matches = index.match_name(client_identifier.lower())
             
             if len(matches) == 1:
                 target_client = matches[0]
             elif len(matches) > 1:
-                return json.dumps({
+                return _dumps({
                     "success": False,
                     "error": f"Multiple clients found matching '{client_identifier}'. Please be more specific or use client ID."
                 })
             elif len(matches) == 0:
-                return json.dumps({
+                return _dumps({
                     "success": False,
                     "error": f"No client found matching '{client_identifier}'."
                 })
         
         if not target_client:
-            return json.dumps({
+            return _dumps({
                 "success": False,
                 "error": f"Client '{client_identifier}' not found."
             })
         
         # Add note to the found client
+        now_iso = datetime.now().isoformat()
         note_entry = {
             "id": len(target_client["notes"]) + 1,
             "content": note,
             "type": note_type,
-            "created_at": datetime.now().isoformat()
+            "created_at": now_iso
         }
         target_client["notes"].append(note_entry)
-        target_client["last_contact"] = datetime.now().isoformat()
+        target_client["last_contact"] = now_iso
         
         # Save updated clients
-        _save_clients(clients)
+        await asyncio.to_thread(_save_clients, clients)
         
-        return json.dumps({
+        return _dumps({
             "success": True,
             "client_id": target_client["id"],
             "client_name": target_client["name"],
@@ -531,7 +589,7 @@ async def add_client_note(
         })
         
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": f"Failed to add note: {str(e)}"
         })
@@ -546,10 +604,10 @@ async def get_client_details(client_id: str) -> Dict[str, Any]:
     multiple candidates for disambiguation.
     """
     try:
-        clients = _load_clients()
+        clients, index = await asyncio.to_thread(_load_indexed_clients)
 
         if not clients:
-            return json.dumps({
+            return _dumps({
                 "success": False,
                 "error": "No clients found."
             })
@@ -559,39 +617,35 @@ async def get_client_details(client_id: str) -> Dict[str, Any]:
         # Numeric ID path
         if identifier.isdigit():
             target_id = int(identifier)
-            for client in clients:
-                if client.get("id") == target_id:
-                    return json.dumps({
-                        "success": True,
-                        "client": client,
-                        "message": f"Retrieved details for client {target_id}."
-                    })
-            return json.dumps({
+            client = index.by_id.get(target_id)
+            if client is not None:
+                return _dumps({
+                    "success": True,
+                    "client": client,
+                    "message": f"Retrieved details for client {target_id}."
+                })
+            return _dumps({
                 "success": False,
                 "error": f"Client with ID {target_id} not found."
             })
 
         # Name-based path (case-insensitive partial match)
-        identifier_lower = identifier.lower().strip()
-        matches = []
-        for client in clients:
-            if identifier_lower in str(client.get("name", "")).lower():
-                matches.append(client)
+        matches = index.match_name(identifier.lower().strip())
 
         if len(matches) == 0:
-            return json.dumps({
+            return _dumps({
                 "success": False,
                 "error": f"No client found matching '{identifier}'."
             })
         elif len(matches) == 1:
             client = matches[0]
-            return json.dumps({
+            return _dumps({
                 "success": True,
                 "client": client,
                 "message": f"Retrieved details for client {client.get('name')} (ID: {client.get('id')})."
             })
         else:
-            return json.dumps({
+            return _dumps({
                 "success": True,
                 "multiple_matches": True,
                 "clients": matches,
@@ -599,12 +653,13 @@ async def get_client_details(client_id: str) -> Dict[str, Any]:
             })
 
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": f"Failed to get client details: {str(e)}"
         })
 
 
+@_serialize_writes
 async def update_client_email(client_identifier: str, email: str) -> Dict[str, Any]:
     """
     Update a client's email by ID or name.
@@ -613,17 +668,17 @@ async def update_client_email(client_identifier: str, email: str) -> Dict[str, A
     Validates basic email format and saves the change.
     """
     try:
-        clients = _load_clients()
+        clients, index = await asyncio.to_thread(_load_indexed_clients)
 
         if not clients:
-            return json.dumps({
+            return _dumps({
                 "success": False,
                 "error": "No clients found."
             })
 
         identifier = (client_identifier or "").strip()
         if not identifier:
-            return json.dumps({
+            return _dumps({
                 "success": False,
                 "error": "Client identifier is required."
             })
@@ -631,7 +686,7 @@ async def update_client_email(client_identifier: str, email: str) -> Dict[str, A
         # Basic email validation (very permissive)
         email_value = (email or "").strip()
         if not email_value or "@" not in email_value or "." not in email_value.split("@")[-1]:
-            return json.dumps({
+            return _dumps({
                 "success": False,
                 "error": "Please provide a valid email address."
             })
@@ -639,24 +694,19 @@ async def update_client_email(client_identifier: str, email: str) -> Dict[str, A
         target_client = None
 
         if identifier.isdigit():
-            target_id = int(identifier)
-            for c in clients:
-                if c.get("id") == target_id:
-                    target_client = c
-                    break
+            target_client = index.by_id.get(int(identifier))
         else:
-            ident_lower = identifier.lower()
-            matches = [c for c in clients if ident_lower in str(c.get("name", "")).lower()]
+            matches = index.match_name(identifier.lower())
             if len(matches) == 1:
                 target_client = matches[0]
             elif len(matches) > 1:
-                return json.dumps({
+                return _dumps({
                     "success": False,
                     "error": f"Multiple clients found matching '{client_identifier}'. Please use the client ID."
                 })
 
         if not target_client:
-            return json.dumps({
+            return _dumps({
                 "success": False,
                 "error": f"Client '{client_identifier}' not found."
             })
@@ -665,7 +715,7 @@ async def update_client_email(client_identifier: str, email: str) -> Dict[str, A
         
         # Check if email is already set to the requested value
         if old_email == email_value:
-            return json.dumps({
+            return _dumps({
                 "success": True,
                 "client_id": target_client.get("id"),
                 "client_name": target_client.get("name"),
@@ -678,9 +728,9 @@ async def update_client_email(client_identifier: str, email: str) -> Dict[str, A
         target_client["email"] = email_value
         target_client["last_contact"] = datetime.now().isoformat()
 
-        _save_clients(clients)
+        await asyncio.to_thread(_save_clients, clients)
 
-        return json.dumps({
+        return _dumps({
             "success": True,
             "client_id": target_client.get("id"),
             "client_name": target_client.get("name"),
@@ -689,7 +739,7 @@ async def update_client_email(client_identifier: str, email: str) -> Dict[str, A
             "message": f"Updated email for {target_client.get('name')} (ID: {target_client.get('id')}) from '{old_email}' to '{email_value}'."
         })
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": f"Failed to update client email: {str(e)}"
         })
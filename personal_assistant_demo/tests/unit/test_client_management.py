@@ -0,0 +1,181 @@
+"""Tests for list_clients pagination and the per-snapshot client index."""
+
+import os
+
+import orjson
+import pytest
+from filelock import FileLock
+
+from personal_assistant.tools import client_management as cm
+from personal_assistant.tools.client_management import _ClientIndex, list_clients
+
+
+def _client(client_id, name, company, priority, email="", status="active"):
+    return {
+        "id": client_id,
+        "name": name,
+        "company": company,
+        "email": email,
+        "priority": priority,
+        "status": status,
+    }
+
+
+CLIENTS = [
+    _client(1, "Sarah Johnson", "Acme", "medium", "sarah@acme.com"),
+    _client(2, "Alex Chen", "Microsoft", "high", "alex@microsoft.com"),
+    _client(3, "Bob Smith", "Acme", "low", "", status="inactive"),
+    _client(4, "Sarah Lee", "Initech", "high", "sarah@acme.com"),
+    _client(5, "Alex Chen", "Microsoft", "medium"),
+]
+
+# CLIENTS in list_clients order: priority (high first), then name, ties in file order
+SORTED_IDS = [2, 4, 5, 1, 3]
+
+
+@pytest.fixture
+def clients_file(tmp_path, monkeypatch):
+    """Point the client tools at a temporary clients file and start from an empty snapshot."""
+    path = tmp_path / "clients.json"
+    monkeypatch.setattr(cm, "CLIENTS_FILE", path)
+    monkeypatch.setattr(cm, "_CLIENTS_LOCK", FileLock(str(path) + ".lock"))
+    monkeypatch.setattr(cm, "_clients_snapshot", [])
+    monkeypatch.setattr(cm, "_clients_snapshot_key", None)
+    monkeypatch.setattr(cm, "_clients_index", _ClientIndex([]))
+    path.write_bytes(orjson.dumps(CLIENTS))
+    return path
+
+
+def _ids(result):
+    return [client["id"] for client in orjson.loads(result)["data"]["clients"]]
+
+
+@pytest.mark.asyncio
+async def test_list_clients_returns_all_clients_by_default(clients_file):
+    """Without a limit every client is returned, high priority first."""
+    data = orjson.loads(await list_clients())["data"]
+
+    assert [client["id"] for client in data["clients"]] == SORTED_IDS
+    assert data["count"] == data["total"] == len(CLIENTS)
+    assert data["offset"] == 0
+    assert data["limit"] is None
+
+
+@pytest.mark.asyncio
+async def test_list_clients_pages_with_limit_and_offset(clients_file):
+    """limit and offset select a window of the sorted clients; total stays the full count."""
+    response = orjson.loads(await list_clients(limit=2, offset=1))
+    data = response["data"]
+
+    assert [client["id"] for client in data["clients"]] == SORTED_IDS[1:3]
+    assert data["count"] == 2
+    assert data["total"] == len(CLIENTS)
+    assert (data["offset"], data["limit"]) == (1, 2)
+    assert "Showing 2-3" in response["message"]
+
+
+@pytest.mark.asyncio
+async def test_list_clients_offset_without_limit_returns_the_rest(clients_file):
+    assert _ids(await list_clients(offset=3)) == SORTED_IDS[3:]
+
+
+@pytest.mark.asyncio
+async def test_list_clients_offset_past_end(clients_file):
+    """An offset past the last client returns an empty page but still reports the total."""
+    response = orjson.loads(await list_clients(limit=2, offset=10))
+    data = response["data"]
+
+    assert data["clients"] == []
+    assert data["count"] == 0
+    assert data["total"] == len(CLIENTS)
+    assert "No clients at offset 10." in response["message"]
+
+
+@pytest.mark.asyncio
+async def test_list_clients_clamps_limit_and_offset(clients_file):
+    data = orjson.loads(await list_clients(limit=0, offset=-5))["data"]
+
+    assert [client["id"] for client in data["clients"]] == SORTED_IDS[:1]
+    assert (data["offset"], data["limit"]) == (0, 1)
+
+
+@pytest.mark.asyncio
+async def test_list_clients_paginates_filtered_clients(clients_file):
+    data = orjson.loads(await list_clients("medium", limit=1, offset=1))["data"]
+
+    assert [client["id"] for client in data["clients"]] == [1]
+    assert data["total"] == 2
+
+
+@pytest.mark.asyncio
+async def test_list_clients_caches_rendered_listing(clients_file):
+    """Repeat calls are served from the snapshot's listings cache."""
+    first = await list_clients("high", limit=1)
+
+    assert cm._clients_index.listings[("high", 1, 0)] is first
+    assert await list_clients("high", limit=1) is first
+    assert await list_clients("high", limit=2) is not first
+
+
+@pytest.mark.asyncio
+async def test_list_clients_cache_is_bounded(clients_file):
+    for offset in range(cm._LISTING_CACHE_SIZE + 5):
+        await list_clients(offset=offset)
+
+    listings = cm._clients_index.listings
+    assert len(listings) == cm._LISTING_CACHE_SIZE
+    assert ("", None, 0) not in listings
+
+
+@pytest.mark.asyncio
+async def test_list_clients_cache_invalidated_when_file_size_changes(clients_file):
+    assert _ids(await list_clients()) == SORTED_IDS
+    old_index = cm._clients_index
+
+    clients_file.write_bytes(orjson.dumps(CLIENTS + [_client(6, "Zed", "Zeta", "high")]))
+
+    assert _ids(await list_clients()) == [2, 4, 6, 5, 1, 3]
+    assert cm._clients_index is not old_index
+
+
+@pytest.mark.asyncio
+async def test_list_clients_cache_invalidated_when_only_mtime_changes(clients_file):
+    await list_clients()
+    old_index = cm._clients_index
+
+    # Same size, so only the modification time tells the snapshots apart
+    renamed = [dict(CLIENTS[0], name="Aarah Johnson")] + CLIENTS[1:]
+    clients_file.write_bytes(orjson.dumps(renamed))
+    stat = clients_file.stat()
+    os.utime(clients_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert stat.st_size == len(orjson.dumps(CLIENTS))
+
+    assert _ids(await list_clients()) == [2, 4, 1, 5, 3]
+    assert cm._clients_index is not old_index
+
+
+def test_client_index_lookups():
+    """Lookup tables keep the first client for each id, email and (name, company) pair."""
+    index = _ClientIndex(CLIENTS)
+
+    assert index.by_id[1] is CLIENTS[0]
+    assert index.id_strings == {"1", "2", "3", "4", "5"}
+    assert index.email_positions == {"sarah@acme.com": 0, "alex@microsoft.com": 1}
+    assert index.name_company_positions[("alex chen", "microsoft")] == 1
+    assert index.name_company_positions[("bob smith", "acme")] == 2
+    assert ("Alex Chen", "Microsoft") not in index.name_company_positions
+
+
+def test_client_index_match_name_is_case_insensitive_in_file_order():
+    index = _ClientIndex(CLIENTS)
+
+    assert index.match_name("sarah") == [CLIENTS[0], CLIENTS[3]]
+    assert index.match_name("chen") == [CLIENTS[1], CLIENTS[4]]
+    assert index.match_name("zzz") == []
+
+
+def test_client_index_by_priority():
+    index = _ClientIndex(CLIENTS)
+
+    assert [client["id"] for client in index.by_priority] == SORTED_IDS
+    assert index.by_priority is index.by_priority
@@ -0,0 +1,96 @@
+"""Tests for PII sanitization."""
+
+import random
+
+import pytest
+
+from personal_assistant.core import sanitizer as sanitizer_module
+from personal_assistant.core.sanitizer import (
+    PIISanitizer,
+    clear_observation_cache,
+    sanitize_observation,
+    sanitize_observations,
+)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Contact john@example.com today", "Contact [REDACTED:EMAIL] today"),
+    ("Mixed case JOHN@EXAMPLE.ORG", "Mixed case [REDACTED:EMAIL]"),
+    ("Call 555-123-4567", "Call [REDACTED:PHONE]"),
+    ("SSN 123-45-6789", "SSN [REDACTED:SSN]"),
+    ("IBAN DE89370400440532013000", "IBAN [REDACTED:IBAN]"),
+    ("token abcdefghijklmnopqrstuvwxyz0123", "token [REDACTED:API_KEY]"),
+    ("Added task abc123: 'Buy milk'", "Added task abc123: 'Buy milk'"),
+    ("123-45-6789 555-123-4567 id", "[REDACTED:SSN] [REDACTED:PHONE] id"),
+])
+def test_sanitize_redacts_each_pii_type(text, expected):
+    """Each PII type is replaced with its own token."""
+    assert PIISanitizer().sanitize(text) == expected
+
+
+def _sanitize_sequentially(sanitizer, text):
+    for pii_type, pattern in sanitizer.patterns.items():
+        text = pattern.sub(f"[REDACTED:{pii_type}]", text)
+    return text
+
+
+def _random_pii_texts(seed, count):
+    """Space- and dash-joined mixes of PII-shaped pieces that overlap between patterns."""
+    rng = random.Random(seed)
+    digits = lambda n: "".join(rng.choice("0123456789") for _ in range(n))
+    pieces = [
+        lambda: f"{digits(3)}-{digits(2)}-{digits(4)}",
+        lambda: f"{digits(3)}-{digits(3)}-{digits(4)}",
+        lambda: f"+1-{digits(3)}-{digits(4)}",
+        lambda: digits(rng.randint(4, 19)),
+        lambda: "jane@corp.io",
+        lambda: "DE89370400440532013000",
+        lambda: "sk1234567890abcdefghijXYZ",
+        lambda: rng.choice(["id", "call", "-", "or", ","]),
+    ]
+    return [
+        rng.choice([" ", "-", ""]).join(rng.choice(pieces)() for _ in range(rng.randint(1, 5)))
+        for _ in range(count)
+    ]
+
+
+def test_sanitize_matches_sequential_patterns():
+    """Sanitizing agrees with applying each pattern in turn on random PII mixes."""
+    sanitizer = PIISanitizer()
+    for text in _random_pii_texts(seed=1234, count=2000):
+        assert sanitizer.sanitize(text) == _sanitize_sequentially(sanitizer, text), text
+
+
+def test_sanitize_observation_truncates_long_output():
+    """Observations are capped for LLM consumption."""
+    result = sanitize_observation("word " * 1000)
+    assert result.endswith("...[OBSERVATION_TRUNCATED]")
+    assert len(result) == 2000 + len("...[OBSERVATION_TRUNCATED]")
+
+
+def test_sanitize_observation_memoizes_short_strings():
+    """Repeated observations are served from the cache."""
+    clear_observation_cache()
+    first = sanitize_observation("Email me at jane@corp.io")
+    second = sanitize_observation("Email me at jane@corp.io")
+
+    assert first == second == "Email me at [REDACTED:EMAIL]"
+    assert sanitizer_module._sanitize_observation_cached.cache_info().hits == 1
+
+
+@pytest.mark.parametrize("texts", [
+    ["Contact john@example.com", "", "Call 555-123-4567", "plain text"],
+    ["tab\tand\x07bell", "SSN 123-45-6789\n"],
+    ["has a \0 separator jane@corp.io", "key abcdefghijklmnopqrstuvwxyz0123"],
+    ["x" * 3000, "john@example.com"],
+    [],
+])
+def test_sanitize_observations_matches_per_item(texts):
+    """The batched sweep gives the same result as sanitizing each observation."""
+    assert sanitize_observations(texts) == [sanitize_observation(text) for text in texts]
+
+
+def test_sanitize_observations_matches_per_item_on_random_pii():
+    """Batching random PII mixes never changes what gets redacted."""
+    texts = _random_pii_texts(seed=5678, count=500)
+    assert sanitize_observations(texts) == [sanitize_observation(text) for text in texts]